@@ -81,6 +81,10 @@ Question: {question}
 
 Please provide a concise answer based on the context above."""
 
+# The system prompt never changes, so build the message object once
+# instead of per generate_answer_step call
+CONTEXT_SYSTEM_MESSAGE = SystemMessage(content=CONTEXT_SYSTEM_PROMPT)
+
 
 # ============================================================================
 # Nodes (Linear Pipeline Steps)
@@ -120,7 +124,7 @@ def generate_answer_step(state: RAGState) -> RAGState:
 
     # Build messages
     messages = [
-        SystemMessage(content=CONTEXT_SYSTEM_PROMPT),
+        CONTEXT_SYSTEM_MESSAGE,
         HumanMessage(
             content=ANSWER_TEMPLATE.format(
                 context=state.context,
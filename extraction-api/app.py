@@ -32,61 +32,58 @@ Run worker (required for actual extraction):
     python worker.py --daemon
 """
 
-import os
-import sys
+import time
 import uuid
 import asyncio
-from pathlib import Path
+import logging
 from typing import Optional, List
 from datetime import datetime
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-import psycopg
 
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
-API_DIR = Path(__file__).parent
-PROJECT_ROOT = API_DIR.parent if (API_DIR.parent / "production").exists() else API_DIR
-PRODUCTION_DIR = PROJECT_ROOT / "production"
+# Shared bootstrap (paths, .env, database URL, pool) lives in config.py
+from config import ensure_import_paths, get_pool, close_pool
 
-sys.path.insert(0, str(PRODUCTION_DIR))
-sys.path.insert(0, str(PROJECT_ROOT))
-sys.path.insert(0, str(API_DIR))
+ensure_import_paths()
 
-from dotenv import load_dotenv
-env_path = PROJECT_ROOT / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
+logger = logging.getLogger("extraction-api")
 
 
 # =============================================================================
 # DATABASE / SUPABASE
 # =============================================================================
 
-def _get_db_url() -> str:
-    """Get direct database URL (without pgbouncer parameter)."""
-    db_url = (
-        os.environ.get("DIRECT_URL") or
-        os.environ.get("PROVES_DATABASE_URL") or
-        os.environ.get("DATABASE_URL")
-    )
-    # Strip pgbouncer param if present (psycopg doesn't support it)
-    if db_url and 'pgbouncer' in db_url:
-        db_url = db_url.split('?')[0]
-    return db_url
-
 
-def get_db_connection():
-    """Get a database connection using psycopg."""
-    db_url = _get_db_url()
-    if not db_url:
-        raise ValueError("DATABASE_URL not set in environment")
-    return psycopg.connect(db_url)
+# Shared by /extract and /extract/job - a single SQL string lets the
+# driver (and server) reuse the parsed statement across both endpoints.
+# The whole URL batch ships as one array parameter unnested server-side,
+# so queueing N URLs is one statement and one round-trip, not N.
+# The WHERE on the conflict arm skips the UPDATE (and the dead tuple +
+# index churn it creates) when the row already holds identical values.
+# %b placeholders send the score and URL array in the binary wire format,
+# skipping text encode/decode on both ends.
+# DISTINCT collapses repeats within the batch - ON CONFLICT DO UPDATE
+# errors out if the same row conflicts twice in one statement.
+QUEUE_URLS_SQL = """
+    INSERT INTO urls_to_process (url, status, quality_score, quality_reason)
+    SELECT DISTINCT u.url, 'pending', %b, %b
+    FROM unnest(%b::text[]) AS u(url)
+    ON CONFLICT (url) DO UPDATE SET
+        status = 'pending',
+        quality_score = EXCLUDED.quality_score,
+        quality_reason = EXCLUDED.quality_reason
+    WHERE urls_to_process.status IS DISTINCT FROM 'pending'
+       OR urls_to_process.quality_score IS DISTINCT FROM EXCLUDED.quality_score
+       OR urls_to_process.quality_reason IS DISTINCT FROM EXCLUDED.quality_reason
+"""
 
 
 # =============================================================================
@@ -154,6 +151,20 @@ class CrawlDiscoveryResponse(BaseModel):
 
 running_tasks = {}
 
+# Finished tasks to keep around for /tasks/{task_id} polling; older ones
+# are pruned so the tracker can't grow without bound in a long-lived API
+MAX_FINISHED_TASKS = 100
+
+
+def _prune_finished_tasks():
+    """Drop the oldest finished tasks once the tracker exceeds the cap."""
+    finished = [
+        tid for tid, task in running_tasks.items()
+        if task["status"] in ("completed", "failed")
+    ]
+    for tid in finished[:-MAX_FINISHED_TASKS]:
+        del running_tasks[tid]
+
 
 async def run_discovery_task(
     task_id: str,
@@ -196,7 +207,9 @@ async def run_discovery_task(
         running_tasks[task_id]["status"] = "failed"
         running_tasks[task_id]["error"] = str(e)
         running_tasks[task_id]["completed_at"] = datetime.utcnow().isoformat()
-        print(f"Discovery task failed: {e}")
+        logger.exception("Discovery task %s failed", task_id)
+
+    _prune_finished_tasks()
 
 
 # =============================================================================
@@ -206,10 +219,11 @@ async def run_discovery_task(
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Startup and shutdown events."""
-    print("PROVES Extraction API starting...")
-    print("NOTE: This API only queues URLs. Run worker.py for extraction.")
+    logger.info("PROVES Extraction API starting...")
+    logger.info("NOTE: This API only queues URLs. Run worker.py for extraction.")
     yield
-    print("PROVES Extraction API shutting down...")
+    close_pool()
+    logger.info("PROVES Extraction API shutting down...")
 
 
 app = FastAPI(
@@ -220,6 +234,9 @@ app = FastAPI(
     ),
     version="2.0.0",
     lifespan=lifespan,
+    # orjson serializes the URL-list and stats payloads faster than the
+    # stdlib encoder FastAPI defaults to
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -278,23 +295,22 @@ async def queue_extraction(request: ExtractRequest):
     urls_queued = 0
 
     try:
-        conn = get_db_connection()
-        with conn.cursor() as cur:
-            for url in request.urls:
-                try:
-                    cur.execute("""
-                        INSERT INTO urls_to_process (url, status, quality_score, quality_reason)
-                        VALUES (%s, 'pending', %s, %s)
-                        ON CONFLICT (url) DO UPDATE SET
-                            status = 'pending',
-                            quality_score = EXCLUDED.quality_score,
-                            quality_reason = EXCLUDED.quality_reason
-                    """, (url, request.quality_score, f"Queued via API (task: {task_id})"))
-                    urls_queued += 1
-                except Exception as e:
-                    print(f"[/extract] Failed to insert URL {url}: {e}")
-            conn.commit()
-        conn.close()
+        # Pooled checkout: commits on clean exit, rolls back (and returns
+        # the connection) when an insert raises
+        with get_pool().connection() as conn:
+            with conn.cursor() as cur:
+                # One statement for the whole request. The reason string
+                # must stay stable across requests - embedding the task id
+                # would defeat the IS DISTINCT FROM guard on the conflict
+                # arm, rewriting every already-queued row on re-submission
+                # (the task id is returned in the response instead).
+                quality_reason = "Queued via API"
+                cur.execute(
+                    QUEUE_URLS_SQL,
+                    (request.quality_score, quality_reason, request.urls),
+                )
+                urls_queued = len(request.urls)
+                conn.commit()
 
         return ExtractResponse(
             task_id=task_id,
@@ -321,77 +337,62 @@ async def acknowledge_job(request: ExtractJobRequest):
     The actual extraction is done by worker.py using the V3 pipeline.
     """
     try:
-        conn = get_db_connection()
-
-        # Get job details
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT id, source_id, status
-                FROM crawl_jobs
-                WHERE id = %s
-            """, (request.job_id,))
-            job_row = cur.fetchone()
-
-        if not job_row:
-            conn.close()
-            raise HTTPException(status_code=404, detail="Job not found")
-
-        job = {"id": job_row[0], "source_id": job_row[1], "status": job_row[2]}
-
-        if job["status"] not in ("pending", "crawling"):
-            conn.close()
-            raise HTTPException(
-                status_code=400,
-                detail=f"Job already {job['status']}"
-            )
-
-        # Get source config
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT id, name, source_type, source_config
-                FROM team_sources
-                WHERE id = %s
-            """, (job["source_id"],))
-            source_row = cur.fetchone()
-
-        if not source_row:
-            conn.close()
-            raise HTTPException(status_code=404, detail="Source not found")
-
-        source = {
-            "id": source_row[0],
-            "name": source_row[1],
-            "source_type": source_row[2],
-            "source_config": source_row[3] or {}
-        }
-        source_type = source.get("source_type")
-        source_config = source.get("source_config", {})
-
-        # For url_list sources, insert URLs into urls_to_process
-        urls_queued = 0
-        if source_type == "url_list":
-            urls = source_config.get("urls", [])
+        # Pooled checkout returns the connection on every exit path,
+        # including the early HTTPException raises below
+        with get_pool().connection() as conn:
+            # Get job + source config in a single round-trip (same JOIN
+            # the worker uses) instead of two sequential SELECTs
             with conn.cursor() as cur:
-                for url in urls:
-                    try:
-                        cur.execute("""
-                            INSERT INTO urls_to_process (url, status, quality_score, quality_reason)
-                            VALUES (%s, 'pending', 0.8, %s)
-                            ON CONFLICT (url) DO UPDATE SET
-                                status = 'pending',
-                                quality_score = EXCLUDED.quality_score,
-                                quality_reason = EXCLUDED.quality_reason
-                        """, (url, f"From source: {source['name']}"))
-                        urls_queued += 1
-                    except Exception as e:
-                        print(f"[/extract/job] Failed to insert URL {url}: {e}")
-                conn.commit()
-
-        conn.close()
-
-        print(
-            f"[/extract/job] Job {request.job_id} acknowledged. "
-            f"Source type: {source_type}, URLs queued: {urls_queued}"
+                cur.execute("""
+                    SELECT cj.id, cj.source_id, cj.status,
+                           ts.id, ts.name, ts.source_type, ts.source_config
+                    FROM crawl_jobs cj
+                    LEFT JOIN team_sources ts ON cj.source_id = ts.id
+                    WHERE cj.id = %s
+                """, (request.job_id,))
+                job_row = cur.fetchone()
+
+            if not job_row:
+                raise HTTPException(status_code=404, detail="Job not found")
+
+            job = {"id": job_row[0], "source_id": job_row[1], "status": job_row[2]}
+
+            if job["status"] not in ("pending", "crawling"):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Job already {job['status']}"
+                )
+
+            if job_row[3] is None:
+                raise HTTPException(status_code=404, detail="Source not found")
+
+            source = {
+                "id": job_row[3],
+                "name": job_row[4],
+                "source_type": job_row[5],
+                "source_config": job_row[6] or {}
+            }
+            source_type = source.get("source_type")
+            source_config = source.get("source_config", {})
+
+            # For url_list sources, insert URLs into urls_to_process
+            urls_queued = 0
+            if source_type == "url_list":
+                urls = source_config.get("urls", [])
+                if urls:
+                    # One statement for the whole source list
+                    quality_reason = f"From source: {source['name']}"
+                    with conn.cursor() as cur:
+                        cur.execute(
+                            QUEUE_URLS_SQL,
+                            (0.8, quality_reason, urls),
+                        )
+                        conn.commit()
+                    urls_queued = len(urls)
+
+        logger.info(
+            "[/extract/job] Job %s acknowledged. Source type: %s, URLs queued: %s",
+            request.job_id, source_type, urls_queued
         )
 
         return ExtractResponse(
@@ -431,18 +432,15 @@ async def get_task_status(task_id: str):
 async def get_job_status(job_id: str):
     """Get status of a crawl job from database."""
     try:
-        conn = get_db_connection()
-
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT id, status, items_found, items_processed, items_failed,
-                       error_message, started_at, completed_at
-                FROM crawl_jobs
-                WHERE id = %s
-            """, (job_id,))
-            row = cur.fetchone()
-
-        conn.close()
+        with get_pool().connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT id, status, items_found, items_processed, items_failed,
+                           error_message, started_at, completed_at
+                    FROM crawl_jobs
+                    WHERE id = %s
+                """, (job_id,))
+                row = cur.fetchone()
 
         if not row:
             raise HTTPException(status_code=404, detail="Job not found")
@@ -512,21 +510,18 @@ async def get_pending_urls():
     Returns URLs from urls_to_process with status='pending'.
     """
     try:
-        conn = get_db_connection()
-
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT url, quality_score, quality_reason,
-                       preview_components, preview_interfaces,
-                       preview_keywords, preview_summary
-                FROM urls_to_process
-                WHERE status = 'pending'
-                ORDER BY quality_score DESC
-                LIMIT 100
-            """)
-            rows = cur.fetchall()
-
-        conn.close()
+        with get_pool().connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("""
+                    SELECT url, quality_score, quality_reason,
+                           preview_components, preview_interfaces,
+                           preview_keywords, preview_summary
+                    FROM urls_to_process
+                    WHERE status = 'pending'
+                    ORDER BY quality_score DESC
+                    LIMIT 100
+                """)
+                rows = cur.fetchall()
 
         return {
             "count": len(rows),
@@ -547,37 +542,46 @@ async def get_pending_urls():
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# The dashboard polls /queue/stats; a short TTL keeps those polls off
+# the database while staying fresh enough for a progress display
+QUEUE_STATS_TTL = 5.0
+_queue_stats_cache = {"expires": 0.0, "data": None}
+
+
 @app.get("/queue/stats")
 async def get_queue_stats():
-    """Get statistics about the extraction queue."""
-    try:
-        conn = get_db_connection()
-
-        with conn.cursor() as cur:
-            # Get URL stats
-            cur.execute("""
-                SELECT status, COUNT(*) as count
-                FROM urls_to_process
-                GROUP BY status
-            """)
-            url_stats = {row[0]: row[1] for row in cur.fetchall()}
-
-            # Get job stats
-            cur.execute("""
-                SELECT status, COUNT(*) as count
-                FROM crawl_jobs
-                GROUP BY status
-            """)
-            job_stats = {row[0]: row[1] for row in cur.fetchall()}
-
-        conn.close()
+    """Get statistics about the extraction queue (cached briefly)."""
+    if _queue_stats_cache["data"] is not None and time.monotonic() < _queue_stats_cache["expires"]:
+        return _queue_stats_cache["data"]
 
-        return {
+    try:
+        with get_pool().connection() as conn:
+            with conn.cursor() as cur:
+                # Both GROUP BYs in one round-trip; the source column says
+                # which table each count came from
+                cur.execute("""
+                    SELECT 'urls' AS source, status, COUNT(*) as count
+                    FROM urls_to_process
+                    GROUP BY status
+                    UNION ALL
+                    SELECT 'jobs' AS source, status, COUNT(*) as count
+                    FROM crawl_jobs
+                    GROUP BY status
+                """)
+                rows = cur.fetchall()
+
+        url_stats = {row[1]: row[2] for row in rows if row[0] == "urls"}
+        job_stats = {row[1]: row[2] for row in rows if row[0] == "jobs"}
+
+        stats = {
             "urls": url_stats,
             "jobs": job_stats,
             "total_pending": url_stats.get("pending", 0),
             "hint": "Run 'python worker.py --daemon' to process queue",
         }
+        _queue_stats_cache["data"] = stats
+        _queue_stats_cache["expires"] = time.monotonic() + QUEUE_STATS_TTL
+        return stats
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
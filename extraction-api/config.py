@@ -0,0 +1,126 @@
+"""
+Shared configuration for the extraction API and worker.
+
+Resolves project paths, loads the .env once, and caches the direct
+database URL so app.py and worker.py don't each carry their own copy
+of the same bootstrap.
+"""
+
+import logging
+import os
+import sys
+from pathlib import Path
+from typing import Optional
+
+import psycopg
+import psycopg_pool
+
+# =============================================================================
+# LOGGING
+# =============================================================================
+
+# Neither uvicorn nor the worker configures the root logger (uvicorn only
+# installs handlers on its own uvicorn.* loggers), and Python's last-resort
+# handler drops everything below WARNING - so without this, the API's and
+# worker's INFO messages go nowhere.
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+# =============================================================================
+# PATHS
+# =============================================================================
+
+API_DIR = Path(__file__).parent
+PROJECT_ROOT = API_DIR.parent if (API_DIR.parent / "production").exists() else API_DIR
+PRODUCTION_DIR = PROJECT_ROOT / "production"
+VERSION3_DIR = PRODUCTION_DIR / "Version 3"
+
+
+def ensure_import_paths() -> None:
+    """Put the project's import roots on sys.path, exactly once.
+
+    app.py, worker.py, and the processors all need the same roots. Each
+    bootstrapping itself with unconditional sys.path.insert grew the path
+    on every import, and every later import pays a linear scan over it.
+    """
+    for path in (VERSION3_DIR, PRODUCTION_DIR, PROJECT_ROOT, API_DIR):
+        entry = str(path)
+        if entry not in sys.path:
+            sys.path.insert(0, entry)
+
+# =============================================================================
+# ENVIRONMENT
+# =============================================================================
+
+from dotenv import load_dotenv
+_env_path = PROJECT_ROOT / ".env"
+if _env_path.exists():
+    load_dotenv(_env_path)
+
+# =============================================================================
+# DATABASE
+# =============================================================================
+
+# Resolved once per process - the environment doesn't change underneath a
+# running service
+_db_url: Optional[str] = None
+
+
+def get_db_url() -> str:
+    """Get direct database URL (without pgbouncer parameter), cached."""
+    global _db_url
+    if _db_url is None:
+        db_url = (
+            os.environ.get("DIRECT_URL") or
+            os.environ.get("PROVES_DATABASE_URL") or
+            os.environ.get("DATABASE_URL")
+        )
+        # Strip pgbouncer param if present (psycopg doesn't support it)
+        if db_url and 'pgbouncer' in db_url:
+            db_url = db_url.split('?')[0]
+        _db_url = db_url
+    return _db_url
+
+
+def connect() -> psycopg.Connection:
+    """Open a new database connection."""
+    db_url = get_db_url()
+    if not db_url:
+        raise ValueError("DATABASE_URL not set in environment")
+    return psycopg.connect(db_url)
+
+
+# Request-scoped work (the API endpoints) checks connections out of a shared
+# pool instead of paying TCP+TLS+auth setup per request. Lazy so importing
+# this module never opens sockets.
+_pool: Optional[psycopg_pool.ConnectionPool] = None
+
+
+def get_pool() -> psycopg_pool.ConnectionPool:
+    """Get the shared connection pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        db_url = get_db_url()
+        if not db_url:
+            raise ValueError("DATABASE_URL not set in environment")
+        # prepare_threshold=1: the endpoints repeat the same handful of
+        # statements (queue upsert, status lookups), so have psycopg
+        # server-prepare them after the first execution and skip the
+        # parse+plan step on every later call
+        _pool = psycopg_pool.ConnectionPool(
+            db_url,
+            min_size=1,
+            max_size=5,
+            kwargs={"prepare_threshold": 1},
+        )
+    return _pool
+
+
+def close_pool() -> None:
+    """Close the shared pool if it was opened (for clean shutdown)."""
+    global _pool
+    if _pool is not None:
+        _pool.close()
+        _pool = None
@@ -10,11 +10,26 @@ Each processor implements:
 2. process() - Run the full extraction pipeline
 """
 
+import re
+import sys
 import uuid
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Dict, Optional, Tuple, Any
 from dataclasses import dataclass
 
+# V3 pipeline location, resolved once at import instead of per processor
+# instance inside the graph property
+_API_DIR = Path(__file__).parent.parent
+_PROJECT_ROOT = _API_DIR.parent
+_VERSION3_DIR = _PROJECT_ROOT / "production" / "Version 3"
+
+# Handles **candidate_key:** markdown format; compiled once, used per result
+_CANDIDATE_KEY_RE = re.compile(
+    r'\*?\*?candidate_key\*?\*?:\*?\*?\s*`?([A-Za-z0-9_:\-\.]+)`?',
+    re.IGNORECASE,
+)
+
 
 @dataclass
 class FetchResult:
@@ -48,28 +63,27 @@ class BaseProcessor(ABC):
     - process() is concrete - shared pipeline invocation logic
     """
 
+    # The compiled V3 graph is stateless between invocations (thread_id is
+    # passed per invoke), so every processor instance - across source types -
+    # shares one copy instead of triggering the heavy import per instance
+    _shared_graph = None
+
     def __init__(self):
         """Initialize processor with lazy-loaded dependencies."""
-        self._graph = None
         self._task_builder = None
 
     @property
     def graph(self):
         """Lazy load the extraction graph (heavy dependencies)."""
-        if self._graph is None:
-            # Import from the V3 pipeline
-            import sys
-            from pathlib import Path
-
-            # Add V3 path
-            api_dir = Path(__file__).parent.parent
-            project_root = api_dir.parent
-            version3_dir = project_root / "production" / "Version 3"
-            sys.path.insert(0, str(version3_dir))
+        if BaseProcessor._shared_graph is None:
+            # Import from the V3 pipeline; only touch sys.path if the
+            # host process (app/worker bootstrap) hasn't already
+            if str(_VERSION3_DIR) not in sys.path:
+                sys.path.insert(0, str(_VERSION3_DIR))
 
             from agent_v3 import graph
-            self._graph = graph
-        return self._graph
+            BaseProcessor._shared_graph = graph
+        return BaseProcessor._shared_graph
 
     @property
     def task_builder(self):
@@ -186,8 +200,13 @@ class BaseProcessor(ABC):
                 else last_message.get("content", str(last_message))
             )
 
+            # Normalize once; the status checks below re-scan this string
+            # and final messages can be long
+            message_upper = final_message.upper()
+            message_lower = final_message.lower()
+
             # Check for rejection
-            if "REJECTED" in final_message.upper():
+            if "REJECTED" in message_upper:
                 return ProcessResult(
                     job_id=job_id,
                     source_url=fetch_result.source_url,
@@ -198,8 +217,8 @@ class BaseProcessor(ABC):
 
             # Check for extraction failure
             if (
-                "snapshot_id" not in final_message.lower()
-                or "no couplings" in final_message.lower()
+                "snapshot_id" not in message_lower
+                or "no couplings" in message_lower
             ):
                 return ProcessResult(
                     job_id=job_id,
@@ -234,7 +253,4 @@ class BaseProcessor(ABC):
         Attempt to count extractions from the final message.
         This is a rough estimate based on candidate_key mentions.
         """
-        import re
-        # Count candidate_key occurrences - handles **candidate_key:** markdown format
-        matches = re.findall(r'\*?\*?candidate_key\*?\*?:\*?\*?\s*`?([A-Za-z0-9_:\-\.]+)`?', message, re.IGNORECASE)
-        return len(matches)
+        return len(_CANDIDATE_KEY_RE.findall(message))
@@ -11,10 +11,10 @@ Context hints can come from:
 - Manual context provided in source_config
 """
 
-import os
+import random
 import re
-import sys
-from pathlib import Path
+import time
+import uuid
 from typing import Dict, Any, Optional, List
 
 from bs4 import BeautifulSoup
@@ -22,6 +22,45 @@ import httpx
 
 from .base import BaseProcessor, FetchResult
 
+# Shared HTTP client so sequential fetches reuse warm keep-alive connections
+# instead of paying TCP+TLS setup for every page.
+_http_client = httpx.Client(
+    timeout=30.0,
+    follow_redirects=True,
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60),
+)
+
+# Transient statuses worth retrying with backoff (rate limits, server hiccups)
+_RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+_MAX_FETCH_ATTEMPTS = 3
+
+# Context hints are capped at 15 entries each, so regex-scanning past the
+# first ~50KB of page text only burns time and allocations on huge pages
+_CONTEXT_SCAN_LIMIT = 50_000
+
+# Context-scan patterns, compiled once instead of per page
+_FPRIME_COMPONENT_RE = re.compile(
+    r'\b([A-Z][a-zA-Z0-9]+)(?:Component(?:Impl|Ac)?|Port|Driver)\b'
+)
+_GENERIC_COMPONENT_RE = re.compile(r'\bclass\s+([A-Z][a-zA-Z0-9]+)\b')
+_HARDWARE_COMPONENT_RE = re.compile(
+    r'\b([A-Z][a-zA-Z0-9]*'
+    r'(?:Board|Chip|Sensor|Module|Controller))\b'
+)
+_PORT_NAME_RE = re.compile(r'\b([a-zA-Z_][a-zA-Z0-9_]*Port)\b')
+_FUNCTION_CALL_RE = re.compile(r'\b([a-z_][a-zA-Z0-9_]*)\(\)')
+
+_TECHNICAL_KEYWORDS = frozenset({
+    "i2c", "spi", "uart", "gpio",
+    "telemetry", "command", "event",
+    "component", "driver", "port",
+    "configuration", "parameter",
+    "dependency", "interface",
+    "power", "battery", "solar",
+    "flight", "mode", "state",
+})
+
 
 class WebProcessor(BaseProcessor):
     """
@@ -72,10 +111,16 @@ class WebProcessor(BaseProcessor):
                 "User-Agent": "PROVES-Library-Curator/1.0 "
                               "(knowledge extraction for CubeSat safety)"
             }
-            with httpx.Client(timeout=30.0, follow_redirects=True) as client:
-                response = client.get(url, headers=headers)
-                response.raise_for_status()
-                html_content = response.text
+            for attempt in range(_MAX_FETCH_ATTEMPTS):
+                response = _http_client.get(url, headers=headers)
+                if response.status_code not in _RETRY_STATUS_CODES:
+                    break
+                if attempt < _MAX_FETCH_ATTEMPTS - 1:
+                    # Exponential backoff with jitter so parallel workers
+                    # don't hammer a rate-limited host in lockstep
+                    time.sleep((2 ** attempt) + random.uniform(0, 0.5))
+            response.raise_for_status()
+            html_content = response.text
         except httpx.HTTPStatusError as e:
             return FetchResult(
                 snapshot_id="",
@@ -97,7 +142,6 @@ class WebProcessor(BaseProcessor):
 
         # Generate a snapshot_id (the actual storage happens in fetch_webpage tool)
         # For now we generate a temporary one - the extractor will create the real one
-        import uuid
         temp_snapshot_id = f"web-{uuid.uuid4().hex[:12]}"
 
         # Extract context if not pre-computed
@@ -143,50 +187,19 @@ class WebProcessor(BaseProcessor):
         for tag in soup(["script", "style", "nav", "header", "footer"]):
             tag.decompose()
 
-        text_content = soup.get_text()
+        text_content = soup.get_text()[:_CONTEXT_SCAN_LIMIT]
         lower_text = text_content.lower()
 
         # Extract components (look for class names, module names)
         components = []
-
-        # F' component patterns
-        fprime_components = re.findall(
-            r'\b([A-Z][a-zA-Z0-9]+)(?:Component(?:Impl|Ac)?|Port|Driver)\b',
-            text_content
-        )
-        components.extend(fprime_components)
-
-        # Generic component patterns
-        generic_components = re.findall(
-            r'\bclass\s+([A-Z][a-zA-Z0-9]+)\b',
-            text_content
-        )
-        components.extend(generic_components)
-
-        # Hardware components
-        hardware_components = re.findall(
-            r'\b([A-Z][a-zA-Z0-9]*'
-            r'(?:Board|Chip|Sensor|Module|Controller))\b',
-            text_content
-        )
-        components.extend(hardware_components)
+        components.extend(_FPRIME_COMPONENT_RE.findall(text_content))
+        components.extend(_GENERIC_COMPONENT_RE.findall(text_content))
+        components.extend(_HARDWARE_COMPONENT_RE.findall(text_content))
 
         # Extract interfaces (ports, functions, APIs)
         interfaces = []
-
-        # Port names
-        port_patterns = re.findall(
-            r'\b([a-zA-Z_][a-zA-Z0-9_]*Port)\b',
-            text_content
-        )
-        interfaces.extend(port_patterns)
-
-        # Function calls
-        function_patterns = re.findall(
-            r'\b([a-z_][a-zA-Z0-9_]*)\(\)',
-            text_content
-        )
-        interfaces.extend(function_patterns[:10])
+        interfaces.extend(_PORT_NAME_RE.findall(text_content))
+        interfaces.extend(_FUNCTION_CALL_RE.findall(text_content)[:10])
 
         # Common interface keywords
         if "tlmchan" in lower_text or "telemetry" in lower_text:
@@ -197,20 +210,7 @@ class WebProcessor(BaseProcessor):
             interfaces.extend(["read()", "write()"])
 
         # Extract technical keywords
-        keywords = []
-        keyword_patterns = {
-            "i2c", "spi", "uart", "gpio",
-            "telemetry", "command", "event",
-            "component", "driver", "port",
-            "configuration", "parameter",
-            "dependency", "interface",
-            "power", "battery", "solar",
-            "flight", "mode", "state",
-        }
-
-        for kw in keyword_patterns:
-            if kw in lower_text:
-                keywords.append(kw)
+        keywords = [kw for kw in _TECHNICAL_KEYWORDS if kw in lower_text]
 
         # Create summary (first paragraph or heading)
         summary = ""
@@ -178,6 +178,33 @@ SOURCE_PREAMBLES = {
     "google_sheet": "Extract architecture from this spreadsheet. Look for configuration tables and dependency matrices.",
 }
 
+# =============================================================================
+# STATIC TASK PREFIX
+# =============================================================================
+
+# The methodology blocks never change between calls, so they are joined once
+# at import time. They lead the prompt so every task shares a byte-identical
+# prefix - providers cache prompt prefixes, and a stable prefix means only
+# the short per-URL tail below is ever "new" tokens. build_extraction_task
+# only interpolates that tail.
+_STATIC_TASK_PREFIX = f"""You are the curator agent for the PROVES Library.
+
+{FRAMES_EXTRACTION_FOCUS}
+
+{CANDIDATE_TYPE_GUIDANCE}
+
+For EACH extraction:
+- Provide exact evidence quotes from source
+- Document confidence reasoning
+- Identify relationships to other components
+- CITE THE SOURCE URL
+- Answer ALL 7 Knowledge Capture Checklist questions
+
+{KNOWLEDGE_CAPTURE_CHECKLIST}
+
+{EPISTEMIC_PATTERN}
+"""
+
 # =============================================================================
 # TASK BUILDER FUNCTIONS
 # =============================================================================
@@ -251,8 +278,7 @@ def build_extraction_task(
     if source_id:
         team_context += f"\nSource ID: {source_id}"
 
-    task = f"""You are the curator agent for the PROVES Library.
-
+    tail = f"""
 YOUR MISSION: {preamble}
 
 URL: {url}{team_context}
@@ -260,25 +286,10 @@ URL: {url}{team_context}
 CONTEXT HINTS (from pre-scan):
 {context_section}
 
-{FRAMES_EXTRACTION_FOCUS}
-
-{CANDIDATE_TYPE_GUIDANCE}
-
-For EACH extraction:
-- Provide exact evidence quotes from source
-- Document confidence reasoning
-- Identify relationships to other components
-- CITE THE SOURCE URL
-- Answer ALL 7 Knowledge Capture Checklist questions
-
-{KNOWLEDGE_CAPTURE_CHECKLIST}
-
-{EPISTEMIC_PATTERN}
-
 Then store ALL extractions in staging_extractions. Work autonomously - no approval needed.
 """
 
-    return task
+    return _STATIC_TASK_PREFIX + tail
 
 
 def build_discord_task(
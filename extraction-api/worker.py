@@ -22,92 +22,127 @@ Environment:
     SUPABASE_SERVICE_ROLE_KEY - Service role key for Supabase
 """
 
-import os
-import sys
 import time
+import logging
 import argparse
-from pathlib import Path
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
-# Setup paths
-API_DIR = Path(__file__).parent
-PROJECT_ROOT = API_DIR.parent
-PRODUCTION_DIR = PROJECT_ROOT / "production"
-VERSION3_DIR = PRODUCTION_DIR / "Version 3"
+# Shared bootstrap (paths, .env, database URL) lives in config.py
+from config import ensure_import_paths, get_db_url
 
-sys.path.insert(0, str(VERSION3_DIR))
-sys.path.insert(0, str(PRODUCTION_DIR))
-sys.path.insert(0, str(PROJECT_ROOT))
-sys.path.insert(0, str(API_DIR))
-
-from dotenv import load_dotenv
-load_dotenv(PROJECT_ROOT / ".env")
+ensure_import_paths()
 
 import psycopg
+from psycopg.rows import dict_row
 
 from processors import WebProcessor
 from processors.base import ProcessResult
 
+logger = logging.getLogger("extraction-worker")
+
+# Console banner separator, built once instead of per print
+_BANNER = "=" * 70
+
+# Progress rows are informational (the dashboard polls them); flushing one
+# UPDATE + commit per URL just multiplied write round-trips for long jobs
+_PROGRESS_UPDATE_EVERY = 5
+
 
 # =============================================================================
 # DATABASE HELPERS
 # =============================================================================
 
-def get_db_url() -> str:
-    """Get direct database URL (without pgbouncer parameter)."""
-    return (
-        os.environ.get("DIRECT_URL") or
-        os.environ.get("PROVES_DATABASE_URL") or
-        os.environ.get("DATABASE_URL")
-    )
+# Single shared connection for the worker process. The worker polls every
+# few seconds, so reconnecting per query paid TCP+TLS+auth setup on every
+# poll; instead we keep one connection and reconnect only if it drops.
+_shared_conn: Optional[psycopg.Connection] = None
 
 
 def get_db_connection():
-    """Get a database connection using psycopg."""
-    db_url = get_db_url()
-    # Strip pgbouncer param if present (psycopg doesn't support it)
-    if db_url and 'pgbouncer' in db_url:
-        db_url = db_url.split('?')[0]
-    if not db_url:
-        raise ValueError("DATABASE_URL not set in environment")
-    return psycopg.connect(db_url)
+    """Get the shared database connection, reconnecting if it was closed."""
+    global _shared_conn
+    if _shared_conn is None or _shared_conn.closed:
+        db_url = get_db_url()
+        if not db_url:
+            raise ValueError("DATABASE_URL not set in environment")
+        # Every worker statement is a standalone read or single-row UPDATE,
+        # so autocommit avoids the implicit BEGIN + explicit COMMIT round-
+        # trips psycopg otherwise wraps around each one. The worker reruns
+        # the same handful of poll/update statements forever, so prepare
+        # them server-side after the first execution and skip re-planning.
+        _shared_conn = psycopg.connect(
+            db_url, autocommit=True, prepare_threshold=1
+        )
+    return _shared_conn
+
+
+def _reset_connection():
+    """Roll back the shared connection after an error so it can be reused."""
+    if _shared_conn is not None and not _shared_conn.closed:
+        try:
+            _shared_conn.rollback()
+        except Exception:
+            _shared_conn.close()
 
 
 # =============================================================================
 # URL QUEUE FUNCTIONS (urls_to_process table)
 # =============================================================================
 
+_PENDING_URLS_SQL = """
+    SELECT url, quality_score, preview_components, preview_interfaces,
+           preview_keywords, preview_summary
+    FROM urls_to_process
+    WHERE status = 'pending'
+    ORDER BY quality_score DESC, discovered_at ASC
+    LIMIT %s
+"""
+
+_PENDING_JOBS_SQL = """
+    SELECT cj.id AS job_id, cj.source_id, cj.status,
+           ts.name, ts.source_type, ts.source_config
+    FROM crawl_jobs cj
+    LEFT JOIN team_sources ts ON cj.source_id = ts.id
+    WHERE cj.status = 'pending'
+    LIMIT %s
+"""
+
+
+def _shape_pending_url(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a urls_to_process row into the worker's URL dict."""
+    return {
+        "url": row["url"],
+        "quality_score": row["quality_score"],
+        "context": {
+            "components": row["preview_components"] or [],
+            "interfaces": row["preview_interfaces"] or [],
+            "keywords": row["preview_keywords"] or [],
+            "summary": row["preview_summary"] or "",
+        },
+    }
+
+
+def _shape_pending_job(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert a crawl_jobs+team_sources row into the worker's job dict."""
+    return {
+        "job_id": str(row["job_id"]),
+        "source_id": str(row["source_id"]) if row["source_id"] else None,
+        "source_type": row["source_type"] or "unknown",
+        "source_config": row["source_config"] or {},
+        "source_name": row["name"] or "Unknown",
+    }
+
+
 def get_pending_urls(limit: int = 10) -> List[Dict[str, Any]]:
     """Get pending URLs from urls_to_process table."""
     conn = get_db_connection()
 
-    with conn.cursor() as cur:
-        cur.execute("""
-            SELECT url, quality_score, preview_components, preview_interfaces,
-                   preview_keywords, preview_summary
-            FROM urls_to_process
-            WHERE status = 'pending'
-            ORDER BY quality_score DESC, discovered_at ASC
-            LIMIT %s
-        """, (limit,))
+    with conn.cursor(row_factory=dict_row) as cur:
+        cur.execute(_PENDING_URLS_SQL, (limit,))
         results = cur.fetchall()
 
-    conn.close()
-
-    return [
-        {
-            "url": row[0],
-            "quality_score": row[1],
-            "context": {
-                "components": row[2] or [],
-                "interfaces": row[3] or [],
-                "keywords": row[4] or [],
-                "summary": row[5] or "",
-            },
-        }
-        for row in results
-    ]
+    return [_shape_pending_url(row) for row in results]
 
 
 def update_url_status(
@@ -116,25 +151,42 @@ def update_url_status(
     error_msg: Optional[str] = None
 ):
     """Update URL status in urls_to_process table."""
-    conn = get_db_connection()
-
-    with conn.cursor() as cur:
-        if status == "completed":
-            cur.execute("""
-                UPDATE urls_to_process
-                SET status = %s, processed_at = NOW(), error_message = NULL
-                WHERE url = %s
-            """, (status, url))
-        else:
-            cur.execute("""
-                UPDATE urls_to_process
-                SET status = %s, error_message = %s
-                WHERE url = %s
-            """, (status, error_msg, url))
-
-        conn.commit()
+    params = {"status": status, "error_msg": error_msg, "url": url}
 
-    conn.close()
+    # A long extraction can outlive the pooler's idle timeout and kill the
+    # shared connection before this write. Losing it would strand the row
+    # in 'processing' (the poller only selects 'pending'), so reset and
+    # retry once on a fresh connection before giving up.
+    for attempt in range(2):
+        try:
+            conn = get_db_connection()
+            with conn.cursor() as cur:
+                # One statement for all statuses (same pattern as
+                # update_job_status): completed stamps processed_at and
+                # clears any stale error, so the driver reuses a single
+                # parsed query for every transition
+                cur.execute("""
+                    UPDATE urls_to_process
+                    SET status = %(status)s,
+                        error_message = CASE
+                            WHEN %(status)s = 'completed' THEN NULL
+                            ELSE %(error_msg)s
+                        END,
+                        processed_at = CASE
+                            WHEN %(status)s = 'completed' THEN NOW()
+                            ELSE processed_at
+                        END
+                    WHERE url = %(url)s
+                """, params)
+            return
+        except psycopg.OperationalError:
+            if attempt == 1:
+                raise
+            # Close the broken connection so the retry dials a fresh one
+            # (a rollback is a local no-op on an idle autocommit
+            # connection, so it wouldn't detect the dead socket)
+            if _shared_conn is not None and not _shared_conn.closed:
+                _shared_conn.close()
 
 
 # =============================================================================
@@ -146,36 +198,53 @@ def get_pending_jobs(limit: int = 5) -> List[Dict[str, Any]]:
     try:
         conn = get_db_connection()
 
-        with conn.cursor() as cur:
-            cur.execute("""
-                SELECT cj.id, cj.source_id, cj.status,
-                       ts.id, ts.name, ts.source_type, ts.source_config
-                FROM crawl_jobs cj
-                LEFT JOIN team_sources ts ON cj.source_id = ts.id
-                WHERE cj.status = 'pending'
-                LIMIT %s
-            """, (limit,))
+        with conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(_PENDING_JOBS_SQL, (limit,))
             rows = cur.fetchall()
 
-        conn.close()
-
-        jobs = []
-        for row in rows:
-            jobs.append({
-                "job_id": str(row[0]),
-                "source_id": str(row[1]) if row[1] else None,
-                "source_type": row[5] or "unknown",
-                "source_config": row[6] or {},
-                "source_name": row[4] or "Unknown",
-            })
-
-        return jobs
+        return [_shape_pending_job(row) for row in rows]
 
     except Exception as e:
         print(f"Error getting pending jobs: {e}")
+        _reset_connection()
         return []
 
 
+def get_pending_work(
+    url_limit: int = 10,
+    job_limit: int = 5,
+) -> tuple:
+    """Fetch pending URLs and pending jobs in one network round-trip.
+
+    The daemon polls both queues every tick, mostly finding nothing.
+    Pipeline mode ships both SELECTs with a single Sync, so an idle tick
+    costs one round-trip instead of two.
+
+    Returns:
+        (urls, jobs) tuple shaped like get_pending_urls/get_pending_jobs
+    """
+    try:
+        conn = get_db_connection()
+
+        with conn.cursor(row_factory=dict_row) as url_cur, \
+                conn.cursor(row_factory=dict_row) as job_cur:
+            with conn.pipeline():
+                url_cur.execute(_PENDING_URLS_SQL, (url_limit,))
+                job_cur.execute(_PENDING_JOBS_SQL, (job_limit,))
+            url_rows = url_cur.fetchall()
+            job_rows = job_cur.fetchall()
+
+        return (
+            [_shape_pending_url(row) for row in url_rows],
+            [_shape_pending_job(row) for row in job_rows],
+        )
+
+    except Exception as e:
+        print(f"Error polling for pending work: {e}")
+        _reset_connection()
+        return [], []
+
+
 def update_job_status(
     job_id: str,
     status: str,
@@ -189,36 +258,37 @@ def update_job_status(
         conn = get_db_connection()
 
         with conn.cursor() as cur:
-            if status == "crawling":
-                cur.execute("""
-                    UPDATE crawl_jobs
-                    SET status = %s, items_found = %s, items_processed = %s,
-                        items_failed = %s, error_message = %s, started_at = NOW()
-                    WHERE id = %s
-                """, (status, items_found, items_processed, items_failed,
-                      error_message, job_id))
-            elif status in ("completed", "failed"):
-                cur.execute("""
-                    UPDATE crawl_jobs
-                    SET status = %s, items_found = %s, items_processed = %s,
-                        items_failed = %s, error_message = %s, completed_at = NOW()
-                    WHERE id = %s
-                """, (status, items_found, items_processed, items_failed,
-                      error_message, job_id))
-            else:
-                cur.execute("""
-                    UPDATE crawl_jobs
-                    SET status = %s, items_found = %s, items_processed = %s,
-                        items_failed = %s, error_message = %s
-                    WHERE id = %s
-                """, (status, items_found, items_processed, items_failed,
-                      error_message, job_id))
-            conn.commit()
-
-        conn.close()
+            # One statement for all statuses - the CASE arms pick which
+            # timestamp to stamp, so the driver reuses a single parsed
+            # query instead of three near-identical variants
+            cur.execute("""
+                UPDATE crawl_jobs
+                SET status = %(status)s,
+                    items_found = %(items_found)s,
+                    items_processed = %(items_processed)s,
+                    items_failed = %(items_failed)s,
+                    error_message = %(error_message)s,
+                    started_at = CASE
+                        WHEN %(status)s = 'crawling' THEN NOW()
+                        ELSE started_at
+                    END,
+                    completed_at = CASE
+                        WHEN %(status)s IN ('completed', 'failed') THEN NOW()
+                        ELSE completed_at
+                    END
+                WHERE id = %(job_id)s
+            """, {
+                "status": status,
+                "items_found": items_found,
+                "items_processed": items_processed,
+                "items_failed": items_failed,
+                "error_message": error_message,
+                "job_id": job_id,
+            })
 
     except Exception as e:
         print(f"Error updating job status: {e}")
+        _reset_connection()
 
 
 # =============================================================================
@@ -234,12 +304,21 @@ PROCESSORS = {
 }
 
 
+# Processors are stateless between jobs, so one instance per source type
+# is enough - constructing (and re-importing the agent graph for) a fresh
+# processor on every item is wasted work.
+_processor_instances: Dict[str, Any] = {}
+
+
 def get_processor(source_type: str):
-    """Get the appropriate processor for a source type."""
-    processor_class = PROCESSORS.get(source_type)
-    if processor_class is None:
-        raise ValueError(f"Unknown source type: {source_type}")
-    return processor_class()
+    """Get the memoized processor for a source type."""
+    processor = _processor_instances.get(source_type)
+    if processor is None:
+        processor_class = PROCESSORS.get(source_type)
+        if processor_class is None:
+            raise ValueError(f"Unknown source type: {source_type}")
+        processor = _processor_instances[source_type] = processor_class()
+    return processor
 
 
 # =============================================================================
@@ -257,10 +336,14 @@ def process_url(url_info: Dict[str, Any], index: int, total: int) -> ProcessResu
     context = url_info["context"]
     source_id = url_info.get("source_id")
 
-    print(f"\n{'='*70}")
-    print(f"Processing [{index}/{total}]: {url}")
-    print(f"{'='*70}")
-    print(f"Quality Score: {url_info.get('quality_score', 'N/A')}")
+    # One write per banner keeps interleaved daemon output readable and
+    # avoids a syscall per line
+    print(
+        f"\n{_BANNER}\n"
+        f"Processing [{index}/{total}]: {url}\n"
+        f"{_BANNER}\n"
+        f"Quality Score: {url_info.get('quality_score', 'N/A')}"
+    )
 
     if context.get("components"):
         print(f"Components: {', '.join(context['components'][:5])}")
@@ -270,8 +353,9 @@ def process_url(url_info: Dict[str, Any], index: int, total: int) -> ProcessResu
     # Update status to processing
     update_url_status(url, "processing")
 
-    # Process with WebProcessor
-    processor = WebProcessor()
+    # Reuse the memoized processor - constructing one per URL threw away
+    # the lazily loaded graph and task_builder between queue items
+    processor = get_processor("web")
     result = processor.process(
         job_id=f"url-{index}",
         source_config={"url": url, "context": context},
@@ -300,10 +384,12 @@ def process_job(job: Dict[str, Any]) -> Dict[str, Any]:
     source_config = job["source_config"]
     source_name = job["source_name"]
 
-    print(f"\n{'='*70}")
-    print(f"Processing Job: {job_id}")
-    print(f"Source: {source_name} ({source_type})")
-    print(f"{'='*70}")
+    print(
+        f"\n{_BANNER}\n"
+        f"Processing Job: {job_id}\n"
+        f"Source: {source_name} ({source_type})\n"
+        f"{_BANNER}"
+    )
 
     # Update status to crawling
     update_job_status(job_id, "crawling")
@@ -336,13 +422,15 @@ def process_job(job: Dict[str, Any]) -> Dict[str, Any]:
             else:
                 failed += 1
 
-            # Update progress
-            update_job_status(
-                job_id, "crawling",
-                items_found=len(urls),
-                items_processed=processed,
-                items_failed=failed,
-            )
+            # Update progress in batches; the final counts are written by
+            # the completion update below
+            if i % _PROGRESS_UPDATE_EVERY == 0:
+                update_job_status(
+                    job_id, "crawling",
+                    items_found=len(urls),
+                    items_processed=processed,
+                    items_failed=failed,
+                )
 
         # Mark complete
         final_status = "completed" if failed == 0 else "completed"
@@ -386,37 +474,37 @@ def process_job(job: Dict[str, Any]) -> Dict[str, Any]:
 
 def run_once(limit: int = 10, job_id: Optional[str] = None):
     """Run worker once and exit."""
-    print(f"\n{'='*70}")
-    print("PROVES Extraction Worker - Single Run")
-    print(f"{'='*70}\n")
+    print(
+        f"\n{_BANNER}\n"
+        "PROVES Extraction Worker - Single Run\n"
+        f"{_BANNER}\n"
+    )
 
     # If specific job requested
     if job_id:
         try:
             conn = get_db_connection()
 
-            with conn.cursor() as cur:
+            with conn.cursor(row_factory=dict_row) as cur:
                 cur.execute("""
-                    SELECT cj.id, cj.source_id, cj.status,
-                           ts.id, ts.name, ts.source_type, ts.source_config
+                    SELECT cj.id AS job_id, cj.source_id, cj.status,
+                           ts.name, ts.source_type, ts.source_config
                     FROM crawl_jobs cj
                     LEFT JOIN team_sources ts ON cj.source_id = ts.id
                     WHERE cj.id = %s
                 """, (job_id,))
                 row = cur.fetchone()
 
-            conn.close()
-
             if not row:
                 print(f"Job not found: {job_id}")
                 return
 
             job = {
-                "job_id": str(row[0]),
-                "source_id": str(row[1]) if row[1] else None,
-                "source_type": row[5] or "unknown",
-                "source_config": row[6] or {},
-                "source_name": row[4] or "Unknown",
+                "job_id": str(row["job_id"]),
+                "source_id": str(row["source_id"]) if row["source_id"] else None,
+                "source_type": row["source_type"] or "unknown",
+                "source_config": row["source_config"] or {},
+                "source_name": row["name"] or "Unknown",
             }
 
             process_job(job)
@@ -424,6 +512,7 @@ def run_once(limit: int = 10, job_id: Optional[str] = None):
 
         except Exception as e:
             print(f"Error fetching job: {e}")
+            _reset_connection()
             return
 
     # Process pending URLs first
@@ -444,50 +533,51 @@ def run_once(limit: int = 10, job_id: Optional[str] = None):
     else:
         print("No pending jobs")
 
-    print(f"\n{'='*70}")
-    print("Worker run complete")
-    print(f"{'='*70}\n")
+    print(
+        f"\n{_BANNER}\n"
+        "Worker run complete\n"
+        f"{_BANNER}\n"
+    )
 
 
 def run_daemon(poll_interval: int = 30):
     """Run worker as daemon, polling continuously."""
-    print(f"\n{'='*70}")
-    print("PROVES Extraction Worker - Daemon Mode")
-    print(f"Poll interval: {poll_interval} seconds")
-    print(f"{'='*70}\n")
+    print(
+        f"\n{_BANNER}\n"
+        "PROVES Extraction Worker - Daemon Mode\n"
+        f"Poll interval: {poll_interval} seconds\n"
+        f"{_BANNER}\n"
+    )
 
     while True:
         try:
-            # Check for pending URLs
-            urls = get_pending_urls(limit=10)
+            # One timestamp per tick - the three log lines describe the
+            # same poll, so there's no need to re-format the clock for each
+            tick_ts = datetime.now().isoformat()
+
+            # Poll both queues in one round-trip
+            urls, jobs = get_pending_work(url_limit=10, job_limit=5)
             if urls:
-                print(f"\n[{datetime.now().isoformat()}] "
-                      f"Processing {len(urls)} URLs...")
+                print(f"\n[{tick_ts}] Processing {len(urls)} URLs...")
                 for i, url_info in enumerate(urls, 1):
                     process_url(url_info, i, len(urls))
 
-            # Check for pending jobs
-            jobs = get_pending_jobs(limit=5)
             if jobs:
-                print(f"\n[{datetime.now().isoformat()}] "
-                      f"Processing {len(jobs)} jobs...")
+                print(f"\n[{tick_ts}] Processing {len(jobs)} jobs...")
                 for job in jobs:
                     process_job(job)
 
             # Sleep if nothing to do
             if not urls and not jobs:
-                print(f"[{datetime.now().isoformat()}] "
-                      f"No work. Sleeping {poll_interval}s...")
+                print(f"[{tick_ts}] No work. Sleeping {poll_interval}s...")
 
             time.sleep(poll_interval)
 
         except KeyboardInterrupt:
             print("\n\nShutting down worker...")
             break
-        except Exception as e:
-            print(f"\n[ERROR] {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Worker poll failed")
             time.sleep(poll_interval)
 
 
@@ -153,7 +153,7 @@ def get_multi_server_client() -> MultiServerMCPClient:
 # Example Agent Workflows
 # ============================================
 
-async def example_knowledge_query():
+async def example_knowledge_query(client, tools, agent):
     """
     Example: Search PROVES Library for knowledge about I2C conflicts.
     """
@@ -161,15 +161,8 @@ async def example_knowledge_query():
     print("Example 1: Knowledge Graph Query")
     print("="*60)
 
-    client = get_multi_server_client()
-    tools = await client.get_tools()
-
     print(f"✓ Loaded {len(tools)} tools from {len(client._server_configs)} server(s)")
 
-    # Create agent
-    model = ChatAnthropic(model="claude-sonnet-4-5-20250929")
-    agent = create_agent(model, tools)
-
     # Run query
     result = await agent.ainvoke({
         "messages": [{
@@ -182,7 +175,7 @@ async def example_knowledge_query():
     print(result["messages"][-1].content)
 
 
-async def example_multi_server_workflow():
+async def example_multi_server_workflow(client, tools, agent):
     """
     Example: Use multiple servers in one workflow.
 
@@ -192,9 +185,6 @@ async def example_multi_server_workflow():
     print("Example 2: Multi-Server Workflow")
     print("="*60)
 
-    client = get_multi_server_client()
-    tools = await client.get_tools()
-
     # Group tools by server
     tools_by_server = {}
     for tool in tools:
@@ -211,10 +201,6 @@ async def example_multi_server_workflow():
         if len(tool_names) > 3:
             print(f"    ... and {len(tool_names) - 3} more")
 
-    # Create agent
-    model = ChatAnthropic(model="claude-sonnet-4-5-20250929")
-    agent = create_agent(model, tools)
-
     # Example workflow: Search PROVES and optionally save results to file
     result = await agent.ainvoke({
         "messages": [{
@@ -227,7 +213,7 @@ async def example_multi_server_workflow():
     print(result["messages"][-1].content)
 
 
-async def example_dimensional_metadata_query():
+async def example_dimensional_metadata_query(client, tools, agent):
     """
     Example: Query verified knowledge layer with dimensional metadata.
 
@@ -237,12 +223,6 @@ async def example_dimensional_metadata_query():
     print("Example 3: Dimensional Metadata Query")
     print("="*60)
 
-    client = get_multi_server_client()
-    tools = await client.get_tools()
-
-    model = ChatAnthropic(model="claude-sonnet-4-5-20250929")
-    agent = create_agent(model, tools)
-
     # Query for entities with specific dimensional characteristics
     result = await agent.ainvoke({
         "messages": [{
@@ -261,7 +241,7 @@ async def example_dimensional_metadata_query():
     print(result["messages"][-1].content)
 
 
-async def example_source_registry_lookup():
+async def example_source_registry_lookup(client, tools, agent):
     """
     Example: Use the source registry to find where to look for specific topics.
     """
@@ -269,12 +249,6 @@ async def example_source_registry_lookup():
     print("Example 4: Source Registry Lookup")
     print("="*60)
 
-    client = get_multi_server_client()
-    tools = await client.get_tools()
-
-    model = ChatAnthropic(model="claude-sonnet-4-5-20250929")
-    agent = create_agent(model, tools)
-
     result = await agent.ainvoke({
         "messages": [{
             "role": "user",
@@ -327,12 +301,19 @@ async def main():
     print("✓ API key found")
     print()
 
-    # Run examples
+    # Run examples with one shared client and one shared agent - creating
+    # them per example re-spawned every stdio server, re-listed tools, and
+    # re-built the model client + react graph four times
     try:
-        await example_knowledge_query()
-        await example_multi_server_workflow()
-        await example_dimensional_metadata_query()
-        await example_source_registry_lookup()
+        client = get_multi_server_client()
+        tools = await client.get_tools()
+        model = ChatAnthropic(model="claude-sonnet-4-5-20250929")
+        agent = create_agent(model, tools)
+
+        await example_knowledge_query(client, tools, agent)
+        await example_multi_server_workflow(client, tools, agent)
+        await example_dimensional_metadata_query(client, tools, agent)
+        await example_source_registry_lookup(client, tools, agent)
 
         print("\n" + "="*60)
         print("All examples completed!")
@@ -6,6 +6,7 @@ Minimal example to get started with the PROVES Library MCP server.
 
 import asyncio
 import os
+import sys
 
 from langchain_anthropic import ChatAnthropic
 from langchain.agents import create_agent
@@ -73,7 +74,10 @@ if __name__ == "__main__":
     print("   cd mcp-server")
     print("   proves-mcp --transport streamable-http --port 8000")
     print()
-    print("2. Press Enter to continue...")
-    input()
+    # Only pause for Enter when a human is actually at the terminal;
+    # piped/CI runs would otherwise block forever on stdin
+    if sys.stdin.isatty():
+        print("2. Press Enter to continue...")
+        input()
 
     asyncio.run(main())
@@ -151,13 +151,16 @@ async def main():
 
     results = {}
 
-    # Run all tests
+    # Local checks run serially (they're instant); the two network checks
+    # overlap their connection waits instead of paying them back to back
     results["packages"] = await test_langchain_packages()
     results["proves_package"] = await test_proves_package()
     results["api_key"] = await test_anthropic_key()
     results["database"] = await test_database_connection()
-    results["server"] = await test_server_running()
-    results["client"] = await test_mcp_client()
+    results["server"], results["client"] = await asyncio.gather(
+        test_server_running(),
+        test_mcp_client(),
+    )
 
     # Summary
     print("\n" + "=" * 60)
@@ -1,35 +1,99 @@
 """Database client for PROVES Library MCP Server."""
 
+import asyncio
+import functools
 import logging
+import time
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator, Optional, List, Dict, Any
 
 import psycopg
 from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
 from pgvector.psycopg import register_vector_async
 
 from proves_mcp.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Supabase's pooler occasionally drops idle connections; a couple of quick
+# retries turn those transient disconnects into a short pause instead of an
+# error the agent has to replan around
+_RETRY_TRIES = 3
+_RETRY_BASE_DELAY = 0.1
+
+
+def _retry_transient(fn):
+    """Retry a read-only query method on transient connection errors.
+
+    Only psycopg.OperationalError is retried (dropped/unreachable
+    connection); data and constraint errors surface immediately. Safe
+    because every decorated method is a pure SELECT.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        delay = _RETRY_BASE_DELAY
+        for attempt in range(_RETRY_TRIES):
+            try:
+                return await fn(*args, **kwargs)
+            except psycopg.OperationalError as e:
+                if attempt == _RETRY_TRIES - 1:
+                    raise
+                logger.warning(
+                    f"{fn.__name__} hit transient DB error ({e}); "
+                    f"retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+                delay *= 2
+    return wrapper
+
 
 class DatabaseClient:
     """Async PostgreSQL client for the PROVES Library knowledge graph."""
 
+    # Stats are polled by health checks and dashboards; a short TTL keeps
+    # those repeat GROUP BY scans off the database
+    STATS_TTL = 30.0
+
     def __init__(self, connection_string: Optional[str] = None):
         self.connection_string = connection_string or settings.database_url
-        self._pool = None
+        self._pool: Optional[AsyncConnectionPool] = None
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_expires: float = 0.0
+
+    @staticmethod
+    async def _configure_connection(conn: psycopg.AsyncConnection) -> None:
+        """Register the pgvector adapter on each new pooled connection."""
+        await register_vector_async(conn)
+
+    async def _get_pool(self) -> AsyncConnectionPool:
+        """Get the shared pool, opening it lazily on first use.
+
+        Lazy so importing the module (or constructing the singleton) never
+        opens sockets; the first query pays the setup once and every later
+        tool call reuses warm connections instead of a fresh TCP+TLS+auth
+        handshake per query.
+        """
+        if self._pool is None:
+            self._pool = AsyncConnectionPool(
+                self.connection_string,
+                min_size=1,
+                max_size=10,
+                open=False,
+                configure=self._configure_connection,
+                kwargs={"row_factory": dict_row},
+            )
+            await self._pool.open()
+        return self._pool
 
     @asynccontextmanager
     async def get_connection(self) -> AsyncGenerator[psycopg.AsyncConnection, None]:
-        """Get a database connection."""
-        async with await psycopg.AsyncConnection.connect(
-            self.connection_string,
-            row_factory=dict_row
-        ) as conn:
-            await register_vector_async(conn)
+        """Check a database connection out of the shared pool."""
+        pool = await self._get_pool()
+        async with pool.connection() as conn:
             yield conn
 
+    @_retry_transient
     async def search_extractions(
         self,
         query: str,
@@ -93,9 +157,10 @@ class DatabaseClient:
 
             async with conn.cursor() as cur:
                 await cur.execute(sql, params)
-                results = await cur.fetchall()
-                return [dict(row) for row in results]
+                # dict_row already yields dicts - no per-row copy needed
+                return await cur.fetchall()
 
+    @_retry_transient
     async def search_core_entities(
         self,
         query: str,
@@ -153,9 +218,9 @@ class DatabaseClient:
 
             async with conn.cursor() as cur:
                 await cur.execute(sql, params)
-                results = await cur.fetchall()
-                return [dict(row) for row in results]
+                return await cur.fetchall()
 
+    @_retry_transient
     async def get_extraction(self, extraction_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a specific extraction by ID.
@@ -180,9 +245,9 @@ class DatabaseClient:
                     """,
                     [extraction_id]
                 )
-                result = await cur.fetchone()
-                return dict(result) if result else None
+                return await cur.fetchone()
 
+    @_retry_transient
     async def get_entity(self, entity_id: str) -> Optional[Dict[str, Any]]:
         """
         Get a verified core entity by ID.
@@ -206,9 +271,9 @@ class DatabaseClient:
                     """,
                     [entity_id]
                 )
-                result = await cur.fetchone()
-                return dict(result) if result else None
+                return await cur.fetchone()
 
+    @_retry_transient
     async def list_entities(
         self,
         entity_type: Optional[str] = None,
@@ -251,41 +316,52 @@ class DatabaseClient:
 
             async with conn.cursor() as cur:
                 await cur.execute(sql, params)
-                results = await cur.fetchall()
-                return [dict(row) for row in results]
+                return await cur.fetchall()
 
-    async def get_extraction_stats(self) -> Dict[str, Any]:
-        """Get statistics about extractions in the system."""
+    @_retry_transient
+    async def _fetch_all(self, sql: str) -> List[Dict[str, Any]]:
+        """Run a parameterless query on its own pooled connection."""
         async with self.get_connection() as conn:
             async with conn.cursor() as cur:
-                await cur.execute("""
-                    SELECT
-                        status,
-                        COUNT(*) as count
-                    FROM staging_extractions
-                    GROUP BY status
-                """)
-                status_counts = await cur.fetchall()
+                await cur.execute(sql)
+                return await cur.fetchall()
 
-                await cur.execute("""
-                    SELECT
-                        candidate_type,
-                        COUNT(*) as count
-                    FROM staging_extractions
-                    GROUP BY candidate_type
-                """)
-                type_counts = await cur.fetchall()
-
-                await cur.execute("""
-                    SELECT COUNT(*) as total FROM core_entities WHERE is_current = TRUE
-                """)
-                entity_count = await cur.fetchone()
-
-                return {
-                    "extraction_status": {row['status']: row['count'] for row in status_counts},
-                    "extraction_types": {row['candidate_type']: row['count'] for row in type_counts},
-                    "verified_entities": entity_count['total'] if entity_count else 0
-                }
+    async def get_extraction_stats(self) -> Dict[str, Any]:
+        """Get statistics about extractions in the system (cached briefly)."""
+        if self._stats_cache is not None and time.monotonic() < self._stats_expires:
+            return self._stats_cache
+
+        # The three aggregates are independent; run them on separate pool
+        # connections so the total latency is the slowest query, not the sum
+        status_counts, type_counts, entity_counts = await asyncio.gather(
+            self._fetch_all("""
+                SELECT
+                    status,
+                    COUNT(*) as count
+                FROM staging_extractions
+                GROUP BY status
+            """),
+            self._fetch_all("""
+                SELECT
+                    candidate_type,
+                    COUNT(*) as count
+                FROM staging_extractions
+                GROUP BY candidate_type
+            """),
+            self._fetch_all("""
+                SELECT COUNT(*) as total FROM core_entities WHERE is_current = TRUE
+            """),
+        )
+
+        stats = {
+            "extraction_status": {row['status']: row['count'] for row in status_counts},
+            "extraction_types": {row['candidate_type']: row['count'] for row in type_counts},
+            "verified_entities": entity_counts[0]['total'] if entity_counts else 0
+        }
+
+        self._stats_cache = stats
+        self._stats_expires = time.monotonic() + self.STATS_TTL
+        return stats
 
 
 # Singleton instance
@@ -8,6 +8,7 @@ Provides "reach" beyond the internal database:
 - Component distributor search (DigiKey, Mouser, LCSC)
 """
 
+import functools
 import logging
 from typing import Optional, List
 import httpx
@@ -318,31 +319,66 @@ async def search_arxiv_papers(
     """
     query_encoded = query.replace(" ", "+")
 
-    # Relevant arXiv categories for space systems
-    relevant_categories = {
-        "astro-ph.IM": "Instrumentation and Methods for Astrophysics",
-        "astro-ph.EP": "Earth and Planetary Astrophysics",
-        "physics.ins-det": "Instrumentation and Detectors",
-        "physics.space-ph": "Space Physics",
-        "cs.SY": "Systems and Control",
-        "cs.RO": "Robotics (for autonomous systems)",
-        "eess.SP": "Signal Processing"
-    }
-
     return {
         "query": query,
         "search_url": f"https://arxiv.org/search/?query={query_encoded}&searchtype=all",
         "category_search": f"https://arxiv.org/search/?query={query_encoded}&searchtype=all&source=header&cat={category}",
-        "relevant_categories": relevant_categories,
+        "relevant_categories": ARXIV_CATEGORIES,
         "api_url": f"http://export.arxiv.org/api/query?search_query=all:{query_encoded}&max_results={limit}",
         "hint": "Use category 'astro-ph.IM' for instrument design, 'cs.SY' for control systems"
     }
 
 
+# Relevant arXiv categories for space systems (static - built once)
+ARXIV_CATEGORIES = {
+    "astro-ph.IM": "Instrumentation and Methods for Astrophysics",
+    "astro-ph.EP": "Earth and Planetary Astrophysics",
+    "physics.ins-det": "Instrumentation and Detectors",
+    "physics.space-ph": "Space Physics",
+    "cs.SY": "Systems and Control",
+    "cs.RO": "Robotics (for autonomous systems)",
+    "eess.SP": "Signal Processing"
+}
+
+
 # ============================================
 # STANDARDS LOOKUP
 # ============================================
 
+# General search hints by topic (static - built once)
+STANDARDS_SEARCH_HINTS = {
+    "telemetry": "CCSDS 133.0-B (Space Packet) and ECSS-E-ST-70-41C (PUS) are key references",
+    "command": "CCSDS 232.0-B for telecommand protocol",
+    "testing": "CubeSat Design Specification Appendix A for environmental test requirements",
+    "mechanical": "CubeSat Design Specification Rev 14 for form factor requirements",
+    "radiation": "ECSS-Q-ST-60C for EEE component requirements"
+}
+
+_DEFAULT_STANDARDS_HINT = (
+    "Check CCSDS for data protocols, ECSS for European standards, "
+    "CDS for CubeSat mechanical specs"
+)
+
+
+# Pure lookup over the static STANDARDS table; agents ask about the same
+# handful of topics over and over, so memoize per normalized topic
+@functools.lru_cache(maxsize=128)
+def _standards_for_topic(topic_lower: str) -> tuple:
+    relevant_standards = []
+    for std_org, std_info in STANDARDS.items():
+        org_standards = [
+            doc for doc in std_info["key_docs"]
+            if topic_lower in doc["topic"] or topic_lower in doc["title"].lower()
+        ]
+        if org_standards:
+            relevant_standards.append({
+                "organization": std_info["name"],
+                "url": std_info["url"],
+                "documents": org_standards
+            })
+    return tuple(relevant_standards)
+
+
 async def lookup_space_standards(
     topic: str
 ) -> dict:
@@ -356,37 +392,12 @@ async def lookup_space_standards(
         Relevant standards from CCSDS, ECSS, and CubeSat spec
     """
     topic_lower = topic.lower()
-    relevant_standards = []
-
-    for std_org, std_info in STANDARDS.items():
-        org_standards = []
-        for doc in std_info["key_docs"]:
-            if topic_lower in doc["topic"] or topic_lower in doc["title"].lower():
-                org_standards.append(doc)
-
-        if org_standards:
-            relevant_standards.append({
-                "organization": std_info["name"],
-                "url": std_info["url"],
-                "documents": org_standards
-            })
-
-    # Add general search hints
-    search_hints = {
-        "telemetry": "CCSDS 133.0-B (Space Packet) and ECSS-E-ST-70-41C (PUS) are key references",
-        "command": "CCSDS 232.0-B for telecommand protocol",
-        "testing": "CubeSat Design Specification Appendix A for environmental test requirements",
-        "mechanical": "CubeSat Design Specification Rev 14 for form factor requirements",
-        "radiation": "ECSS-Q-ST-60C for EEE component requirements"
-    }
-
-    hint = search_hints.get(topic_lower, "Check CCSDS for data protocols, ECSS for European standards, CDS for CubeSat mechanical specs")
 
     return {
         "topic": topic,
-        "standards": relevant_standards,
+        "standards": list(_standards_for_topic(topic_lower)),
         "all_organizations": {k: v["url"] for k, v in STANDARDS.items()},
-        "hint": hint
+        "hint": STANDARDS_SEARCH_HINTS.get(topic_lower, _DEFAULT_STANDARDS_HINT)
     }
 
 
@@ -444,6 +455,48 @@ async def web_search_suggestions(
 # ALTERNATIVE COMPONENT FINDER
 # ============================================
 
+# Known equivalents database, keyed by normalized (separator-stripped
+# lowercase) part name so lookups don't re-normalize the keys per call
+COMPONENT_EQUIVALENTS = {
+    "ms5611": {
+        "description": "Barometric pressure sensor",
+        "interface": "I2C/SPI",
+        "alternatives": [
+            {"part": "BMP390", "manufacturer": "Bosch", "notes": "Lower noise, I2C/SPI"},
+            {"part": "LPS22HB", "manufacturer": "ST", "notes": "Lower power, I2C/SPI"},
+            {"part": "DPS310", "manufacturer": "Infineon", "notes": "High precision"}
+        ]
+    },
+    "bno085": {
+        "description": "9-DOF IMU with sensor fusion",
+        "interface": "I2C/SPI/UART",
+        "alternatives": [
+            {"part": "BNO055", "manufacturer": "Bosch", "notes": "Older, widely available"},
+            {"part": "ICM-42688-P", "manufacturer": "TDK/InvenSense", "notes": "No fusion, raw data"},
+            {"part": "LSM6DSO32", "manufacturer": "ST", "notes": "6-DOF only, add magnetometer"}
+        ]
+    },
+    "sx1262": {
+        "description": "LoRa transceiver",
+        "interface": "SPI",
+        "alternatives": [
+            {"part": "SX1276/77/78", "manufacturer": "Semtech", "notes": "Older generation"},
+            {"part": "LLCC68", "manufacturer": "Semtech", "notes": "Lower cost variant"},
+            {"part": "RFM95W", "manufacturer": "HopeRF", "notes": "Module with SX1276"}
+        ]
+    },
+    "maxm10s": {
+        "description": "GPS/GNSS module",
+        "interface": "UART/I2C",
+        "alternatives": [
+            {"part": "SAM-M10Q", "manufacturer": "u-blox", "notes": "Integrated antenna"},
+            {"part": "NEO-M9N", "manufacturer": "u-blox", "notes": "Multi-constellation"},
+            {"part": "L86", "manufacturer": "Quectel", "notes": "Lower cost option"}
+        ]
+    }
+}
+
+
 async def find_alternative_components(
     component: str,
     specs: Optional[dict] = None
@@ -460,50 +513,9 @@ async def find_alternative_components(
     Returns:
         Known alternatives and search suggestions
     """
-    # Known equivalents database
-    equivalents = {
-        "ms5611": {
-            "description": "Barometric pressure sensor",
-            "interface": "I2C/SPI",
-            "alternatives": [
-                {"part": "BMP390", "manufacturer": "Bosch", "notes": "Lower noise, I2C/SPI"},
-                {"part": "LPS22HB", "manufacturer": "ST", "notes": "Lower power, I2C/SPI"},
-                {"part": "DPS310", "manufacturer": "Infineon", "notes": "High precision"}
-            ]
-        },
-        "bno085": {
-            "description": "9-DOF IMU with sensor fusion",
-            "interface": "I2C/SPI/UART",
-            "alternatives": [
-                {"part": "BNO055", "manufacturer": "Bosch", "notes": "Older, widely available"},
-                {"part": "ICM-42688-P", "manufacturer": "TDK/InvenSense", "notes": "No fusion, raw data"},
-                {"part": "LSM6DSO32", "manufacturer": "ST", "notes": "6-DOF only, add magnetometer"}
-            ]
-        },
-        "sx1262": {
-            "description": "LoRa transceiver",
-            "interface": "SPI",
-            "alternatives": [
-                {"part": "SX1276/77/78", "manufacturer": "Semtech", "notes": "Older generation"},
-                {"part": "LLCC68", "manufacturer": "Semtech", "notes": "Lower cost variant"},
-                {"part": "RFM95W", "manufacturer": "HopeRF", "notes": "Module with SX1276"}
-            ]
-        },
-        "max-m10s": {
-            "description": "GPS/GNSS module",
-            "interface": "UART/I2C",
-            "alternatives": [
-                {"part": "SAM-M10Q", "manufacturer": "u-blox", "notes": "Integrated antenna"},
-                {"part": "NEO-M9N", "manufacturer": "u-blox", "notes": "Multi-constellation"},
-                {"part": "L86", "manufacturer": "Quectel", "notes": "Lower cost option"}
-            ]
-        }
-    }
-
     component_lower = component.lower().replace("-", "").replace("_", "").replace(" ", "")
 
-    for key, info in equivalents.items():
-        key_normalized = key.replace("-", "").replace("_", "")
+    for key_normalized, info in COMPONENT_EQUIVALENTS.items():
         if key_normalized in component_lower or component_lower in key_normalized:
             return {
                 "component": component,
@@ -23,23 +23,60 @@ class SourceRegistry:
         self.registry_path = registry_path or settings.source_registry_path
         self._data: Dict[str, Any] = {}
         self._loaded = False
-    
+        self._mtime: float = 0.0
+        self._hardware_index: List[tuple] = []
+        self._i2c_index: Dict[Any, List[str]] = {}
+
     def load(self) -> None:
-        """Load the source registry from YAML file."""
-        if self._loaded:
-            return
-        
+        """Load the source registry, re-reading the YAML only when it changes.
+
+        A stat() per call is cheap; parsing the YAML is not, and the old
+        load-once behaviour meant registry edits needed a server restart.
+        """
         if not self.registry_path.exists():
             logger.warning(f"Source registry not found at {self.registry_path}")
             self._data = {}
             return
-        
+
+        mtime = self.registry_path.stat().st_mtime
+        if self._loaded and mtime == self._mtime:
+            return
+
         with open(self.registry_path, 'r') as f:
             self._data = yaml.safe_load(f)
-        
+
         self._loaded = True
+        self._mtime = mtime
+
+        # Lowercased fuzzy-match index, rebuilt only when the YAML reloads,
+        # so get_hardware_info doesn't re-lower every key and description
+        # on each lookup
+        hardware = (self._data or {}).get('proveskit', {}).get('hardware', {})
+        self._hardware_index = [
+            (key.lower(), info.get('description', '').lower(), info)
+            for key, info in hardware.items()
+        ]
+
+        # I2C address -> hardware names, so collision checks are a dict
+        # probe instead of a scan over every registered component
+        self._i2c_index = {}
+        for key, info in hardware.items():
+            addr = info.get('i2c_address')
+            if addr is not None:
+                self._i2c_index.setdefault(addr, []).append(key)
+
         logger.info(f"Loaded source registry from {self.registry_path}")
     
+    @property
+    def epoch(self) -> float:
+        """Mtime of the currently loaded registry file.
+
+        Callers can key caches on this so cached derivations are dropped
+        automatically when the YAML is edited and reloaded.
+        """
+        self.load()
+        return self._mtime
+
     @property
     def fprime(self) -> Dict[str, Any]:
         """Get F' framework configuration."""
@@ -133,13 +170,12 @@ class SourceRegistry:
         if hardware_name in hardware:
             return hardware[hardware_name]
         
-        # Fuzzy match
-        for key, info in hardware.items():
-            if hardware_name.lower() in key.lower():
+        # Fuzzy match against the precomputed lowercase index
+        name_lower = hardware_name.lower()
+        for key_lower, desc_lower, info in self._hardware_index:
+            if name_lower in key_lower or name_lower in desc_lower:
                 return info
-            if 'description' in info and hardware_name.lower() in info['description'].lower():
-                return info
-        
+
         return None
     
     def get_fprime_repo_url(self) -> str:
@@ -152,6 +188,25 @@ class SourceRegistry:
         self.load()
         return self.proveskit.get('repos', {})
 
+    def get_i2c_collisions(self, hardware_name: str, address: Any) -> List[str]:
+        """
+        Get other registered hardware sharing an I2C address.
+
+        Args:
+            hardware_name: Component to exclude from the result
+            address: I2C address to look up (as stored in the registry)
+
+        Returns:
+            Names of other components registered at the same address
+        """
+        self.load()
+
+        name_lower = hardware_name.lower()
+        return [
+            name for name in self._i2c_index.get(address, [])
+            if name.lower() != name_lower
+        ]
+
     def get_all_hardware(self) -> Dict[str, Dict[str, Any]]:
         """Get all hardware components from the registry."""
         self.load()
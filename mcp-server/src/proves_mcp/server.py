@@ -9,9 +9,9 @@ Exposes the knowledge graph through MCP tools for:
 
 import argparse
 import asyncio
+import functools
 import logging
 from typing import Optional, List
-import httpx
 
 from fastmcp import FastMCP
 
@@ -68,25 +68,40 @@ async def search_knowledge(
             "extractions": []
         }
 
-        # Search verified entities
-        entities = await db.search_core_entities(
+        entity_search = db.search_core_entities(
             query=query,
             entity_type=entity_type,
             ecosystem=ecosystem,
             limit=limit
         )
-        results["entities"] = entities
 
-        # Optionally include pending extractions
         if include_pending:
-            extractions = await db.search_extractions(
-                query=query,
-                candidate_type=entity_type,
-                ecosystem=ecosystem,
-                status="pending",
-                limit=limit
+            # Both searches hit independent tables - run them concurrently
+            # instead of paying the two query latencies back to back.
+            # return_exceptions keeps a failure in one search from throwing
+            # away the other's results; the failed side comes back empty.
+            entities, extractions = await asyncio.gather(
+                entity_search,
+                db.search_extractions(
+                    query=query,
+                    candidate_type=entity_type,
+                    ecosystem=ecosystem,
+                    status="pending",
+                    limit=limit
+                ),
+                return_exceptions=True
             )
+            if isinstance(entities, BaseException):
+                logger.error(f"entity search failed: {entities}")
+                entities = []
+            if isinstance(extractions, BaseException):
+                logger.error(f"extraction search failed: {extractions}")
+                extractions = []
             results["extractions"] = extractions
+        else:
+            entities = await entity_search
+
+        results["entities"] = entities
 
         results["total"] = len(results["entities"]) + len(results["extractions"])
         return results
@@ -166,6 +181,52 @@ async def get_library_stats() -> dict:
         return {"error": str(e)}
 
 
+# ============================================
+# MANUFACTURER DATASHEET REGISTRY
+# ============================================
+
+# Shared by get_hardware_info and get_datasheet_links so the links live
+# (and get updated) in exactly one place
+DATASHEETS = {
+    "ms5611": {
+        "manufacturer": "TE Connectivity",
+        "datasheet": "https://www.te.com/commerce/DocumentDelivery/DDEController?Action=showdoc&DocId=Data+Sheet%7FMS5611-01BA03%7FB3%7Fpdf%7FEnglish%7FENG_DS_MS5611-01BA03_B3.pdf",
+        "product_page": "https://www.te.com/en/product-CAT-BLPS0036.html",
+        "notes": "Barometric pressure sensor, I2C/SPI, address 0x76 or 0x77"
+    },
+    "bno085": {
+        "manufacturer": "CEVA/Bosch",
+        "datasheet": "https://www.ceva-ip.com/wp-content/uploads/2019/10/BNO080_085-Datasheet.pdf",
+        "product_page": "https://www.ceva-ip.com/product/bno085/",
+        "notes": "9-DOF IMU with sensor fusion, I2C address 0x4A or 0x4B"
+    },
+    "rv3032": {
+        "manufacturer": "Micro Crystal",
+        "datasheet": "https://www.microcrystal.com/fileadmin/Media/Products/RTC/App.Manual/RV-3032-C7_App-Manual.pdf",
+        "product_page": "https://www.microcrystal.com/en/products/real-time-clock-rtc-modules/rv-3032-c7/",
+        "notes": "Real-time clock with temperature compensation, I2C address 0x51"
+    },
+    "sx1262": {
+        "manufacturer": "Semtech",
+        "datasheet": "https://www.semtech.com/products/wireless-rf/lora-connect/sx1262#documentation",
+        "product_page": "https://www.semtech.com/products/wireless-rf/lora-connect/sx1262",
+        "notes": "LoRa transceiver, SPI interface"
+    },
+    "max_m10s": {
+        "manufacturer": "u-blox",
+        "datasheet": "https://www.u-blox.com/en/docs/UBX-20035208",
+        "product_page": "https://www.u-blox.com/en/product/max-m10-series",
+        "notes": "GPS/GNSS module, UART interface"
+    },
+    "w25q": {
+        "manufacturer": "Winbond",
+        "datasheet": "https://www.winbond.com/resource-files/w25q128jv%20revf%2003272018%20plus.pdf",
+        "product_page": "https://www.winbond.com/hq/product/code-storage-flash-memory/serial-nor-flash/",
+        "notes": "128Mbit NOR flash, SPI interface"
+    }
+}
+
+
 # ============================================
 # SOURCE REGISTRY TOOLS
 # ============================================
@@ -223,20 +284,11 @@ async def get_hardware_info(hardware_name: str) -> dict:
     try:
         info = registry.get_hardware_info(hardware_name)
         if info:
-            # Add manufacturer datasheet suggestions
-            datasheets = {
-                "rv3032": "https://www.microcrystal.com/fileadmin/Media/Products/RTC/App.Manual/RV-3032-C7_App-Manual.pdf",
-                "bno085": "https://www.ceva-ip.com/wp-content/uploads/2019/10/BNO080_085-Datasheet.pdf",
-                "ms5611": "https://www.te.com/commerce/DocumentDelivery/DDEController?Action=showdoc&DocId=Data+Sheet%7FMS5611-01BA03%7FB3%7Fpdf%7FEnglish%7FENG_DS_MS5611-01BA03_B3.pdf",
-                "sx1262": "https://www.semtech.com/products/wireless-rf/lora-connect/sx1262",
-                "max_m10s": "https://www.u-blox.com/en/product/max-m10-series",
-                "w25q": "https://www.winbond.com/resource-files/w25q128jv%20revf%2003272018%20plus.pdf"
-            }
-
+            # Add manufacturer datasheet suggestions from the shared registry
             normalized_name = hardware_name.lower().replace("-", "_").replace(" ", "_")
-            for key, url in datasheets.items():
+            for key, entry in DATASHEETS.items():
                 if key in normalized_name:
-                    info["datasheet_url"] = url
+                    info["datasheet_url"] = entry["datasheet"]
                     break
 
             return {
@@ -254,6 +306,40 @@ async def get_hardware_info(hardware_name: str) -> dict:
         return {"error": str(e)}
 
 
+# Agents re-ask about the same few components while working through a
+# document (often with varying casing), and the scan below is pure over
+# the registry contents. A small LRU keyed on the registry's load epoch
+# makes repeat lookups free while still seeing registry edits.
+@functools.lru_cache(maxsize=32)
+def _scan_conflicts(component_lower: str, registry_epoch: float) -> tuple:
+    """Scan the registry for a component's conflicts (cached per epoch)."""
+    hardware_info = registry.get_hardware_info(component_lower)
+    if not hardware_info:
+        return None, ()
+
+    conflicts = [
+        {
+            "target": c.get('component', 'unknown'),
+            "reason": c.get('reason', 'Unknown conflict'),
+            "mitigation": c.get('mitigation', 'Check datasheets for alternative configurations')
+        }
+        for c in hardware_info.get('known_conflicts', [])
+    ]
+
+    # Check for I2C address conflicts with other registered hardware
+    # (dict probe against the registry's precomputed address index)
+    if 'i2c_address' in hardware_info:
+        addr = hardware_info['i2c_address']
+        for hw_name in registry.get_i2c_collisions(component_lower, addr):
+            conflicts.append({
+                "target": hw_name,
+                "reason": f"Same I2C address: {addr}",
+                "mitigation": "Use alternate address pin or I2C multiplexer"
+            })
+
+    return hardware_info, tuple(conflicts)
+
+
 @mcp.tool()
 async def find_conflicts(component: str) -> dict:
     """
@@ -269,34 +355,10 @@ async def find_conflicts(component: str) -> dict:
         List of known conflicts with descriptions and mitigation hints
     """
     try:
-        hardware_info = registry.get_hardware_info(component)
-
-        conflicts = []
-        if hardware_info:
-            known = hardware_info.get('known_conflicts', [])
-            conflicts = [
-                {
-                    "source": component,
-                    "target": c.get('component', 'unknown'),
-                    "reason": c.get('reason', 'Unknown conflict'),
-                    "mitigation": c.get('mitigation', 'Check datasheets for alternative configurations')
-                }
-                for c in known
-            ]
-
-            # Check for I2C address conflicts with other registered hardware
-            if 'i2c_address' in hardware_info:
-                addr = hardware_info['i2c_address']
-                all_hardware = registry.get_all_hardware()
-                for hw_name, hw_info in all_hardware.items():
-                    if hw_name.lower() != component.lower():
-                        if hw_info.get('i2c_address') == addr:
-                            conflicts.append({
-                                "source": component,
-                                "target": hw_name,
-                                "reason": f"Same I2C address: {addr}",
-                                "mitigation": "Use alternate address pin or I2C multiplexer"
-                            })
+        hardware_info, scanned = _scan_conflicts(
+            component.lower(), registry.epoch
+        )
+        conflicts = [{"source": component, **c} for c in scanned]
 
         return {
             "component": component,
@@ -481,94 +543,132 @@ async def search_fprime_docs(query: str) -> dict:
     Returns:
         Links to relevant F' documentation pages
     """
-    # Map common topics to F' documentation pages
-    doc_mappings = {
-        "rate": {
-            "title": "Rate Groups and Scheduling",
-            "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/rate-groups.html",
-            "description": "How rate groups schedule component execution"
-        },
-        "command": {
-            "title": "Commands",
-            "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/commands.html",
-            "description": "Defining and dispatching commands"
-        },
-        "telemetry": {
-            "title": "Telemetry",
-            "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/telemetry.html",
-            "description": "Telemetry channels and downlink"
-        },
-        "event": {
-            "title": "Events",
-            "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/events.html",
-            "description": "Event logging and severity levels"
-        },
-        "parameter": {
-            "title": "Parameters",
-            "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/parameters.html",
-            "description": "Runtime-configurable parameters"
-        },
-        "port": {
-            "title": "Ports",
-            "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/ports.html",
-            "description": "Component interconnection ports"
-        },
-        "component": {
-            "title": "Components",
-            "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/components.html",
-            "description": "Building F' components"
-        },
-        "topology": {
-            "title": "Topologies",
-            "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/topologies.html",
-            "description": "System topology and integration"
-        },
-        "fpp": {
-            "title": "FPP Language Guide",
-            "url": "https://nasa.github.io/fpp/fpp-users-guide.html",
-            "description": "F Prime Prime modeling language"
-        },
-        "driver": {
-            "title": "Drivers",
-            "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/drivers.html",
-            "description": "Hardware drivers and interfaces"
-        },
-        "tutorial": {
-            "title": "Tutorials",
-            "url": "https://nasa.github.io/fprime/latest/tutorials/",
-            "description": "Step-by-step F' tutorials"
-        }
-    }
-
     query_lower = query.lower()
-    relevant_docs = []
-
-    for key, doc in doc_mappings.items():
-        if key in query_lower:
-            relevant_docs.append(doc)
-
-    # Always include general references
-    general_refs = [
-        {
-            "title": "F' User Guide",
-            "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/",
-            "description": "Complete F' user documentation"
-        },
-        {
-            "title": "F' GitHub Repository",
-            "url": "https://github.com/nasa/fprime",
-            "description": "Source code and examples"
-        }
+    relevant_docs = [
+        doc for key, doc in FPRIME_DOC_MAPPINGS.items() if key in query_lower
     ]
 
     return {
         "query": query,
-        "relevant_docs": relevant_docs if relevant_docs else general_refs,
-        "all_topics": list(doc_mappings.keys()),
+        "relevant_docs": relevant_docs if relevant_docs else FPRIME_GENERAL_REFS,
+        "all_topics": list(FPRIME_DOC_MAPPINGS.keys()),
         "hint": "Use these links to find detailed documentation on your topic"
     }
 
 
+# Map common topics to F' documentation pages (static - built once)
+FPRIME_DOC_MAPPINGS = {
+    "rate": {
+        "title": "Rate Groups and Scheduling",
+        "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/rate-groups.html",
+        "description": "How rate groups schedule component execution"
+    },
+    "command": {
+        "title": "Commands",
+        "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/commands.html",
+        "description": "Defining and dispatching commands"
+    },
+    "telemetry": {
+        "title": "Telemetry",
+        "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/telemetry.html",
+        "description": "Telemetry channels and downlink"
+    },
+    "event": {
+        "title": "Events",
+        "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/events.html",
+        "description": "Event logging and severity levels"
+    },
+    "parameter": {
+        "title": "Parameters",
+        "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/parameters.html",
+        "description": "Runtime-configurable parameters"
+    },
+    "port": {
+        "title": "Ports",
+        "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/ports.html",
+        "description": "Component interconnection ports"
+    },
+    "component": {
+        "title": "Components",
+        "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/components.html",
+        "description": "Building F' components"
+    },
+    "topology": {
+        "title": "Topologies",
+        "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/topologies.html",
+        "description": "System topology and integration"
+    },
+    "fpp": {
+        "title": "FPP Language Guide",
+        "url": "https://nasa.github.io/fpp/fpp-users-guide.html",
+        "description": "F Prime Prime modeling language"
+    },
+    "driver": {
+        "title": "Drivers",
+        "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/drivers.html",
+        "description": "Hardware drivers and interfaces"
+    },
+    "tutorial": {
+        "title": "Tutorials",
+        "url": "https://nasa.github.io/fprime/latest/tutorials/",
+        "description": "Step-by-step F' tutorials"
+    }
+}
+
+
+FPRIME_GENERAL_REFS = [
+    {
+        "title": "F' User Guide",
+        "url": "https://nasa.github.io/fprime/latest/documentation/user-guide/",
+        "description": "Complete F' user documentation"
+    },
+    {
+        "title": "F' GitHub Repository",
+        "url": "https://github.com/nasa/fprime",
+        "description": "Source code and examples"
+    }
+]
+
+
+# PROVES Kit repository links (static - built once)
+PROVESKIT_REPOS = {
+    "flight_software": {
+        "title": "Flight Software",
+        "url": "https://github.com/proveskit/flight-software",
+        "description": "F'-based flight software for PROVES missions"
+    },
+    "pysquared": {
+        "title": "PySquared",
+        "url": "https://github.com/proveskit/pysquared",
+        "description": "CircuitPython-based flight software"
+    },
+    "avionics": {
+        "title": "Avionics Board",
+        "url": "https://github.com/proveskit/avionics-board",
+        "description": "Hardware design files"
+    },
+    "documentation": {
+        "title": "Documentation",
+        "url": "https://proveskit.github.io/",
+        "description": "Official PROVES Kit documentation"
+    }
+}
+
+# Topic to repo mapping
+PROVESKIT_TOPIC_MAPPINGS = {
+    "power": ["flight_software", "avionics"],
+    "radio": ["flight_software", "pysquared"],
+    "gps": ["flight_software", "pysquared"],
+    "sensor": ["flight_software", "pysquared", "avionics"],
+    "i2c": ["flight_software", "pysquared"],
+    "spi": ["flight_software", "pysquared"],
+    "hardware": ["avionics"],
+    "board": ["avionics"],
+    "python": ["pysquared"],
+    "circuitpython": ["pysquared"]
+}
+
+
 @mcp.tool()
 async def search_proveskit_docs(query: str) -> dict:
     """
@@ -583,59 +683,21 @@ async def search_proveskit_docs(query: str) -> dict:
     Returns:
         Links to relevant PROVES Kit resources
     """
-    # PROVES Kit repository links
-    repos = {
-        "flight_software": {
-            "title": "Flight Software",
-            "url": "https://github.com/proveskit/flight-software",
-            "description": "F'-based flight software for PROVES missions"
-        },
-        "pysquared": {
-            "title": "PySquared",
-            "url": "https://github.com/proveskit/pysquared",
-            "description": "CircuitPython-based flight software"
-        },
-        "avionics": {
-            "title": "Avionics Board",
-            "url": "https://github.com/proveskit/avionics-board",
-            "description": "Hardware design files"
-        },
-        "documentation": {
-            "title": "Documentation",
-            "url": "https://proveskit.github.io/",
-            "description": "Official PROVES Kit documentation"
-        }
-    }
-
-    # Topic to repo mapping
-    topic_mappings = {
-        "power": ["flight_software", "avionics"],
-        "radio": ["flight_software", "pysquared"],
-        "gps": ["flight_software", "pysquared"],
-        "sensor": ["flight_software", "pysquared", "avionics"],
-        "i2c": ["flight_software", "pysquared"],
-        "spi": ["flight_software", "pysquared"],
-        "hardware": ["avionics"],
-        "board": ["avionics"],
-        "python": ["pysquared"],
-        "circuitpython": ["pysquared"]
-    }
-
     query_lower = query.lower()
     relevant_repos = set()
 
-    for topic, repo_list in topic_mappings.items():
+    for topic, repo_list in PROVESKIT_TOPIC_MAPPINGS.items():
         if topic in query_lower:
             relevant_repos.update(repo_list)
 
     # If no specific matches, return all
     if not relevant_repos:
-        relevant_repos = set(repos.keys())
+        relevant_repos = set(PROVESKIT_REPOS.keys())
 
     return {
         "query": query,
-        "relevant_repos": [repos[r] for r in relevant_repos if r in repos],
-        "all_repos": list(repos.values()),
+        "relevant_repos": [PROVESKIT_REPOS[r] for r in relevant_repos if r in PROVESKIT_REPOS],
+        "all_repos": list(PROVESKIT_REPOS.values()),
         "hint": "Check these repositories for PROVES Kit-specific implementations"
     }
 
@@ -651,49 +713,9 @@ async def get_datasheet_links(component: str) -> dict:
     Returns:
         Links to manufacturer datasheets and application notes
     """
-    # Manufacturer documentation links
-    datasheets = {
-        "ms5611": {
-            "manufacturer": "TE Connectivity",
-            "datasheet": "https://www.te.com/commerce/DocumentDelivery/DDEController?Action=showdoc&DocId=Data+Sheet%7FMS5611-01BA03%7FB3%7Fpdf%7FEnglish%7FENG_DS_MS5611-01BA03_B3.pdf",
-            "product_page": "https://www.te.com/en/product-CAT-BLPS0036.html",
-            "notes": "Barometric pressure sensor, I2C/SPI, address 0x76 or 0x77"
-        },
-        "bno085": {
-            "manufacturer": "CEVA/Bosch",
-            "datasheet": "https://www.ceva-ip.com/wp-content/uploads/2019/10/BNO080_085-Datasheet.pdf",
-            "product_page": "https://www.ceva-ip.com/product/bno085/",
-            "notes": "9-DOF IMU with sensor fusion, I2C address 0x4A or 0x4B"
-        },
-        "rv3032": {
-            "manufacturer": "Micro Crystal",
-            "datasheet": "https://www.microcrystal.com/fileadmin/Media/Products/RTC/App.Manual/RV-3032-C7_App-Manual.pdf",
-            "product_page": "https://www.microcrystal.com/en/products/real-time-clock-rtc-modules/rv-3032-c7/",
-            "notes": "Real-time clock with temperature compensation, I2C address 0x51"
-        },
-        "sx1262": {
-            "manufacturer": "Semtech",
-            "datasheet": "https://www.semtech.com/products/wireless-rf/lora-connect/sx1262#documentation",
-            "product_page": "https://www.semtech.com/products/wireless-rf/lora-connect/sx1262",
-            "notes": "LoRa transceiver, SPI interface"
-        },
-        "max-m10s": {
-            "manufacturer": "u-blox",
-            "datasheet": "https://www.u-blox.com/en/docs/UBX-20035208",
-            "product_page": "https://www.u-blox.com/en/product/max-m10-series",
-            "notes": "GPS/GNSS module, UART interface"
-        },
-        "w25q128": {
-            "manufacturer": "Winbond",
-            "datasheet": "https://www.winbond.com/resource-files/w25q128jv%20revf%2003272018%20plus.pdf",
-            "product_page": "https://www.winbond.com/hq/product/code-storage-flash-memory/serial-nor-flash/",
-            "notes": "128Mbit NOR flash, SPI interface"
-        }
-    }
-
     component_lower = component.lower().replace("-", "").replace("_", "").replace(" ", "")
 
-    for key, info in datasheets.items():
+    for key, info in DATASHEETS.items():
         key_normalized = key.replace("-", "").replace("_", "")
         if key_normalized in component_lower or component_lower in key_normalized:
             return {
@@ -705,7 +727,7 @@ async def get_datasheet_links(component: str) -> dict:
     return {
         "component": component,
         "found": False,
-        "available_components": list(datasheets.keys()),
+        "available_components": list(DATASHEETS.keys()),
         "hint": "Component not in registry. Check manufacturer website directly."
     }
 
@@ -0,0 +1,16 @@
+"""Shared database connection for the check_* diagnostic scripts.
+
+Pairs with _env.py: one place owns how these scripts connect, so the
+boilerplate (and any future connection options) isn't copied per script.
+"""
+import psycopg
+
+from _env import get_db_url
+
+
+def get_connection() -> psycopg.Connection:
+    """Open a connection using the project's direct database URL."""
+    db_url = get_db_url()
+    if not db_url:
+        raise SystemExit("DATABASE_URL not set in environment")
+    return psycopg.connect(db_url)
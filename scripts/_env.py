@@ -0,0 +1,20 @@
+"""Shared environment loading for the check_* diagnostic scripts.
+
+Loads the project .env once on import and resolves the direct database
+URL the same way everywhere (DIRECT_URL preferred, pgbouncer parameter
+stripped since psycopg doesn't understand it).
+"""
+import os
+from pathlib import Path
+from dotenv import load_dotenv
+
+PROJECT_ROOT = Path(__file__).parent.parent
+load_dotenv(PROJECT_ROOT / '.env')
+
+
+def get_db_url() -> str:
+    """Return the direct database URL without the pgbouncer parameter."""
+    db_url = os.environ.get('DIRECT_URL') or os.environ.get('DATABASE_URL')
+    if db_url and 'pgbouncer' in db_url:
+        db_url = db_url.split('?')[0]
+    return db_url
@@ -1,18 +1,47 @@
 """Check if epistemic metadata is being stored in extractions."""
-import os
-import json
-import psycopg
-from dotenv import load_dotenv
-from pathlib import Path
+import sys
 
-project_root = Path(__file__).parent.parent
-load_dotenv(project_root / '.env')
+from _db import get_connection
 
-db_url = os.environ.get('DIRECT_URL') or os.environ.get('DATABASE_URL')
-if db_url and 'pgbouncer' in db_url:
-    db_url = db_url.split('?')[0]
+# Payload/evidence dumps are multi-KB per row; only pay the serialization
+# and terminal I/O cost when explicitly asked for
+VERBOSE = "-v" in sys.argv or "--verbose" in sys.argv
 
-conn = psycopg.connect(db_url)
+# orjson serializes the large jsonb payloads far faster; fall back to the
+# stdlib when it isn't installed (orjson only offers 2-space indent)
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+
+def _preview(obj, limit: int) -> str:
+    """Dump roughly `limit` chars without serializing the whole object.
+
+    Payloads can carry multi-KB evidence strings; trimming values and
+    stopping once the budget is spent keeps serialization proportional
+    to what actually gets printed.
+    """
+    if isinstance(obj, dict):
+        trimmed = {}
+        budget = limit
+        for key, value in obj.items():
+            if isinstance(value, str) and len(value) > budget:
+                value = value[:budget] + "..."
+            trimmed[key] = value
+            budget -= len(key) + len(str(value))
+            if budget <= 0:
+                break
+        obj = trimmed
+    return _dumps(obj)[:limit]
+
+conn = get_connection()
 
 print("=" * 60)
 print("EPISTEMIC METADATA CHECK")
@@ -63,12 +92,13 @@ with conn.cursor() as cur:
                         print(f"    {k}: {v}")
                 else:
                     print(f"  NO EPISTEMIC FIELDS in payload")
-                    print(f"  Full payload sample: {json.dumps(payload, indent=4)[:500]}...")
+                    if VERBOSE:
+                        print(f"  Full payload sample: {_preview(payload, 500)}...")
 
             # Check evidence field
             print(f"\n  EVIDENCE keys: {list(evidence.keys()) if evidence else 'None'}")
-            if evidence:
-                print(f"  Evidence sample: {json.dumps(evidence, indent=4)[:300]}...")
+            if evidence and VERBOSE:
+                print(f"  Evidence sample: {_preview(evidence, 300)}...")
 
             print()
 
@@ -1,18 +1,7 @@
 """Check if epistemic metadata is being stored in knowledge_epistemics sidecar."""
-import os
-import json
-import psycopg
-from dotenv import load_dotenv
-from pathlib import Path
+from _db import get_connection
 
-project_root = Path(__file__).parent.parent
-load_dotenv(project_root / '.env')
-
-db_url = os.environ.get('DIRECT_URL') or os.environ.get('DATABASE_URL')
-if db_url and 'pgbouncer' in db_url:
-    db_url = db_url.split('?')[0]
-
-conn = psycopg.connect(db_url)
+conn = get_connection()
 
 print("=" * 60)
 print("KNOWLEDGE EPISTEMICS SIDECAR CHECK")
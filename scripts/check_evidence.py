@@ -1,27 +1,21 @@
 """Quick script to check evidence in snapshot."""
-import os
-import psycopg
-import json
 import re
-from dotenv import load_dotenv
-from pathlib import Path
 
-project_root = Path(__file__).parent.parent
-load_dotenv(project_root / '.env')
+from _db import get_connection
 
-db_url = os.environ.get('DIRECT_URL') or os.environ.get('DATABASE_URL')
-conn = psycopg.connect(db_url)
+conn = get_connection()
 
-# Get the snapshot content
+# Get just the snapshot content - extracting the field server-side avoids
+# shipping and parsing the rest of the jsonb payload
 with conn.cursor() as cur:
     cur.execute('''
-        SELECT payload
+        SELECT payload->>'content'
         FROM raw_snapshots
         WHERE id = 'd7b48c36-1816-4d47-8964-7db6ce0477bb'::uuid
     ''')
     row = cur.fetchone()
 
-payload_content = row[0].get('content', '')
+payload_content = row[0] or ''
 
 # Strip HTML (same as validator does)
 payload_stripped = re.sub(r'<script[^>]*>.*?</script>', '', payload_content, flags=re.DOTALL)
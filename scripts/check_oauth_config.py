@@ -1,11 +1,8 @@
 """Check OAuth provider configuration in Supabase."""
 import os
 import requests
-from dotenv import load_dotenv
-from pathlib import Path
 
-project_root = Path(__file__).parent.parent
-load_dotenv(project_root / '.env')
+import _env  # noqa: F401 - loads the project .env on import
 
 SUPABASE_URL = os.environ.get('VITE_SUPABASE_URL') or 'https://guigtpwxlqwueylbbcpx.supabase.co'
 
@@ -1,17 +1,7 @@
 """Check what RLS policies exist on staging_extractions."""
-import os
-import psycopg
-from dotenv import load_dotenv
-from pathlib import Path
+from _db import get_connection
 
-project_root = Path(__file__).parent.parent
-load_dotenv(project_root / '.env')
-
-db_url = os.environ.get('DIRECT_URL') or os.environ.get('DATABASE_URL')
-if db_url and 'pgbouncer' in db_url:
-    db_url = db_url.split('?')[0]
-
-conn = psycopg.connect(db_url)
+conn = get_connection()
 
 print("=" * 60)
 print("RLS POLICIES ON staging_extractions")
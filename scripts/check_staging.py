@@ -1,36 +1,33 @@
 """Quick script to check what's in staging_extractions."""
-import os
-import psycopg
-from dotenv import load_dotenv
-from pathlib import Path
+from psycopg.rows import dict_row
 
-project_root = Path(__file__).parent.parent
-load_dotenv(project_root / '.env')
+from _db import get_connection
 
-db_url = os.environ.get('DIRECT_URL') or os.environ.get('DATABASE_URL')
-# Strip pgbouncer param if present
-if db_url and 'pgbouncer' in db_url:
-    db_url = db_url.split('?')[0]
-
-conn = psycopg.connect(db_url)
+conn = get_connection()
 
 print("=" * 60)
 print("STAGING_EXTRACTIONS STATUS")
 print("=" * 60)
 
-with conn.cursor() as cur:
-    # Count by status
+# dict_row so rows read by column name instead of fragile positions
+with conn.cursor(row_factory=dict_row) as cur:
+    # Count both tables by status in one round-trip
     cur.execute("""
-        SELECT status, COUNT(*) as count
+        SELECT 'staging' as source, status, COUNT(*) as count
         FROM staging_extractions
         GROUP BY status
+        UNION ALL
+        SELECT 'urls' as source, status, COUNT(*) as count
+        FROM urls_to_process
+        GROUP BY status
         ORDER BY count DESC
     """)
-    rows = cur.fetchall()
+    status_rows = cur.fetchall()
 
     print("\nStatus counts:")
-    for row in rows:
-        print(f"  {row[0]}: {row[1]}")
+    for row in status_rows:
+        if row['source'] == 'staging':
+            print(f"  {row['status']}: {row['count']}")
 
     # Show recent extractions
     cur.execute("""
@@ -44,25 +41,17 @@ with conn.cursor() as cur:
 
     print(f"\nRecent extractions (last 10):")
     for row in rows:
-        print(f"  [{row[3]}] {row[2]}: {row[1]} (conf={row[4]}, lineage={row[5]})")
-        print(f"           created: {row[6]}")
+        print(f"  [{row['status']}] {row['candidate_type']}: {row['candidate_key']} "
+              f"(conf={row['confidence_score']}, lineage={row['lineage_verified']})")
+        print(f"           created: {row['created_at']}")
 
 print("\n" + "=" * 60)
 print("URLS_TO_PROCESS STATUS")
 print("=" * 60)
 
-with conn.cursor() as cur:
-    # Count by status
-    cur.execute("""
-        SELECT status, COUNT(*) as count
-        FROM urls_to_process
-        GROUP BY status
-        ORDER BY count DESC
-    """)
-    rows = cur.fetchall()
-
-    print("\nStatus counts:")
-    for row in rows:
-        print(f"  {row[0]}: {row[1]}")
+print("\nStatus counts:")
+for row in status_rows:
+    if row['source'] == 'urls':
+        print(f"  {row['status']}: {row['count']}")
 
 conn.close()
@@ -0,0 +1,75 @@
+-- Migration 038: Trigram indexes for substring search
+-- The MCP server's search tools use ILIKE '%query%' against candidate_key
+-- and the core_entities name columns. Leading-wildcard patterns can't use
+-- btree indexes, so every search scanned the tables sequentially. pg_trgm
+-- GIN indexes let those same ILIKE queries use index probes instead.
+
+BEGIN;
+
+-- =============================================================================
+-- ENABLE pg_trgm
+-- =============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- =============================================================================
+-- TRIGRAM INDEXES ON SEARCHED COLUMNS
+-- =============================================================================
+
+-- staging_extractions: searched by search_extractions
+CREATE INDEX IF NOT EXISTS idx_staging_extractions_candidate_key_trgm
+    ON staging_extractions USING gin (candidate_key gin_trgm_ops);
+
+-- core_entities: searched by search_core_entities
+CREATE INDEX IF NOT EXISTS idx_core_entities_canonical_key_trgm
+    ON core_entities USING gin (canonical_key gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_core_entities_name_trgm
+    ON core_entities USING gin (name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_core_entities_display_name_trgm
+    ON core_entities USING gin (display_name gin_trgm_ops);
+
+-- =============================================================================
+-- VERIFICATION
+-- =============================================================================
+
+DO $$
+DECLARE
+    v_count INTEGER;
+BEGIN
+    -- Verify the extension is available
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'
+    ) THEN
+        RAISE EXCEPTION 'pg_trgm extension not installed';
+    END IF;
+
+    -- Count the trigram indexes created by this migration
+    SELECT COUNT(*) INTO v_count
+    FROM pg_indexes
+    WHERE indexname IN (
+        'idx_staging_extractions_candidate_key_trgm',
+        'idx_core_entities_canonical_key_trgm',
+        'idx_core_entities_name_trgm',
+        'idx_core_entities_display_name_trgm'
+    );
+
+    IF v_count < 4 THEN
+        RAISE EXCEPTION 'Expected 4 trigram indexes, found %', v_count;
+    END IF;
+
+    RAISE NOTICE '========================================';
+    RAISE NOTICE 'Migration 038: Trigram Search Indexes';
+    RAISE NOTICE '========================================';
+    RAISE NOTICE '';
+    RAISE NOTICE 'pg_trgm enabled; indexes created:';
+    RAISE NOTICE '  - staging_extractions.candidate_key';
+    RAISE NOTICE '  - core_entities.canonical_key';
+    RAISE NOTICE '  - core_entities.name';
+    RAISE NOTICE '  - core_entities.display_name';
+    RAISE NOTICE '';
+    RAISE NOTICE 'ILIKE ''%%query%%'' searches on these columns can now use GIN probes.';
+END $$;
+
+COMMIT;
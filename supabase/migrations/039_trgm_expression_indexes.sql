@@ -0,0 +1,65 @@
+-- Migration 039: Trigram indexes on searched expressions
+-- Migration 038 covered the plain text columns the MCP search tools hit
+-- with ILIKE '%query%', but the same queries also match against casted
+-- expressions: candidate_payload::text and evidence->>'source_text' on
+-- staging_extractions, and attributes::text on core_entities. Those still
+-- forced sequential scans. Expression GIN indexes with gin_trgm_ops let
+-- the planner probe an index for every arm of the OR instead.
+
+BEGIN;
+
+-- =============================================================================
+-- TRIGRAM INDEXES ON SEARCHED EXPRESSIONS
+-- =============================================================================
+
+-- staging_extractions: payload and evidence text arms of search_extractions
+CREATE INDEX IF NOT EXISTS idx_staging_extractions_payload_trgm
+    ON staging_extractions USING gin ((candidate_payload::text) gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_staging_extractions_evidence_text_trgm
+    ON staging_extractions USING gin (((evidence->>'source_text')::text) gin_trgm_ops);
+
+-- core_entities: attributes arm of search_core_entities
+CREATE INDEX IF NOT EXISTS idx_core_entities_attributes_trgm
+    ON core_entities USING gin ((attributes::text) gin_trgm_ops);
+
+-- =============================================================================
+-- VERIFICATION
+-- =============================================================================
+
+DO $$
+DECLARE
+    v_count INTEGER;
+BEGIN
+    -- pg_trgm was enabled by migration 038; fail loudly if it is missing
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'
+    ) THEN
+        RAISE EXCEPTION 'pg_trgm extension not installed (run migration 038 first)';
+    END IF;
+
+    SELECT COUNT(*) INTO v_count
+    FROM pg_indexes
+    WHERE indexname IN (
+        'idx_staging_extractions_payload_trgm',
+        'idx_staging_extractions_evidence_text_trgm',
+        'idx_core_entities_attributes_trgm'
+    );
+
+    IF v_count < 3 THEN
+        RAISE EXCEPTION 'Expected 3 trigram expression indexes, found %', v_count;
+    END IF;
+
+    RAISE NOTICE '========================================';
+    RAISE NOTICE 'Migration 039: Trigram Expression Indexes';
+    RAISE NOTICE '========================================';
+    RAISE NOTICE '';
+    RAISE NOTICE 'Expression indexes created:';
+    RAISE NOTICE '  - staging_extractions.candidate_payload::text';
+    RAISE NOTICE '  - staging_extractions.evidence->>''source_text''';
+    RAISE NOTICE '  - core_entities.attributes::text';
+    RAISE NOTICE '';
+    RAISE NOTICE 'All ILIKE arms of the MCP search queries are now indexable.';
+END $$;
+
+COMMIT;